@@ -0,0 +1,99 @@
+"""
+Token-overlap similarity kernels for originality detection
+
+Vectorized NumPy passes over the flat corpus index built by
+originality_detection._CorpusIndex.
+"""
+
+import numpy as np
+
+
+def token_overlap(
+    in_query: np.ndarray,
+    token_ids: np.ndarray,
+    doc_of: np.ndarray,
+    entry_is_keyword: np.ndarray,
+    token_counts: np.ndarray,
+    keyword_counts: np.ndarray,
+    n_tokens: int,
+    n_keywords: int
+) -> tuple:
+    """
+    Token Jaccard and keyword overlap of a query against every claim.
+
+    The corpus is stored flat: entry j holds vocabulary id token_ids[j] of
+    claim doc_of[j]. in_query marks the vocabulary ids present in the
+    query. Keyword overlap is shared keywords over the larger keyword set.
+    Both ratios are 0 where either side has nothing to compare.
+    """
+
+    n = token_counts.shape[0]
+    hits = in_query[token_ids]
+    shared = np.bincount(doc_of, weights=hits, minlength=n)
+    shared_keywords = np.bincount(doc_of, weights=hits & entry_is_keyword, minlength=n)
+
+    jaccard = np.zeros(n)
+    if n_tokens:
+        union = n_tokens + token_counts - shared
+        np.divide(shared, union, out=jaccard, where=token_counts > 0)
+
+    overlap = np.zeros(n)
+    if n_keywords:
+        largest = np.maximum(keyword_counts, n_keywords)
+        np.divide(shared_keywords, largest, out=overlap, where=keyword_counts > 0)
+
+    return jaccard, overlap
+
+
+def token_overlap_batch(
+    in_query: np.ndarray,
+    postings_offsets: np.ndarray,
+    postings_docs: np.ndarray,
+    vocab_is_keyword: np.ndarray,
+    token_counts: np.ndarray,
+    keyword_counts: np.ndarray,
+    n_tokens: np.ndarray,
+    n_keywords: np.ndarray
+) -> tuple:
+    """
+    token_overlap for several queries at once.
+
+    in_query is (vocabulary, queries); n_tokens and n_keywords hold one
+    count per query. The corpus is given inverted: the claims containing
+    vocabulary id v are postings_docs[postings_offsets[v]:postings_offsets[v + 1]].
+    Shared counts for every (query, claim) pair come from one bincount over
+    the postings of the queries' tokens, i.e. the sparse product of the
+    claim-by-vocabulary matrix with in_query, so only claims sharing a
+    token are touched. Returns (queries, claims) Jaccard and keyword-overlap
+    arrays, identical row for row to calling token_overlap per query.
+    """
+
+    n = token_counts.shape[0]
+    q = in_query.shape[1]
+    vocab_ids, query_of = np.nonzero(in_query)
+
+    # Gather the postings of every (token, query) pair into one flat array
+    starts = postings_offsets[vocab_ids]
+    lengths = postings_offsets[vocab_ids + 1] - starts
+    ends = np.cumsum(lengths)
+    total = int(ends[-1]) if len(ends) else 0
+    flat = np.arange(total) + np.repeat(starts - (ends - lengths), lengths)
+    cells = np.repeat(query_of * n, lengths) + postings_docs[flat]
+
+    shared = np.bincount(cells, minlength=q * n).reshape(q, n).astype(np.float64)
+    shared_keywords = np.bincount(
+        cells, weights=np.repeat(vocab_is_keyword[vocab_ids], lengths), minlength=q * n
+    ).reshape(q, n)
+
+    n_tokens = np.asarray(n_tokens, dtype=np.float64).reshape(q, 1)
+    n_keywords = np.asarray(n_keywords, dtype=np.float64).reshape(q, 1)
+
+    jaccard = np.zeros((q, n))
+    union = n_tokens + token_counts - shared
+    np.divide(shared, union, out=jaccard, where=(n_tokens > 0) & (token_counts > 0))
+
+    overlap = np.zeros((q, n))
+    largest = np.maximum(keyword_counts, n_keywords)
+    np.divide(shared_keywords, largest, out=overlap, where=(n_keywords > 0) & (keyword_counts > 0))
+
+    return jaccard, overlap
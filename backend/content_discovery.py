@@ -12,8 +12,12 @@ This module handles intelligent content discovery based on:
 
 import os
 import json
+import time
+import asyncio
 import logging
-from typing import List, Dict, Any, Optional, Tuple
+import functools
+import itertools
+from typing import Callable, List, Dict, Any, Optional, Tuple
 from dataclasses import dataclass
 from enum import Enum
 from datetime import datetime
@@ -24,6 +28,44 @@ load_dotenv()
 
 logger = logging.getLogger(__name__)
 
+# Upper bound on claims whose signals are computed at the same time
+MAX_CONCURRENT_SIGNALS = 200
+
+# Diversity indicator bits, in label order
+DIV_CONTRARIAN = 1 << 0
+DIV_EMERGING = 1 << 1
+DIV_EVIDENCE_BASED = 1 << 2
+DIV_DIVERSE_DISCUSSION = 1 << 3
+
+_DIV_BIT_LABELS = (
+    (DIV_CONTRARIAN, "contrarian_view"),
+    (DIV_EMERGING, "emerging_perspective"),
+    (DIV_EVIDENCE_BASED, "evidence_based"),
+    (DIV_DIVERSE_DISCUSSION, "diverse_discussion"),
+)
+
+# Label tuple for every possible bitmask value
+_DIV_LABELS = tuple(
+    tuple(label for bit, label in _DIV_BIT_LABELS if bits & bit)
+    for bits in range(1 << len(_DIV_BIT_LABELS))
+)
+
+
+def diversity_bits(claim: Dict[str, Any]) -> int:
+    """Encode a claim's diversity indicators as a bitmask"""
+    
+    perspective = claim.get('perspective_type')
+    bits = 0
+    if perspective == 'contrarian':
+        bits |= DIV_CONTRARIAN
+    elif perspective == 'emerging':
+        bits |= DIV_EMERGING
+    if claim.get('has_citations', False):
+        bits |= DIV_EVIDENCE_BASED
+    if claim.get('annotation_diversity_score', 0) > 70:
+        bits |= DIV_DIVERSE_DISCUSSION
+    return bits
+
 
 class DiscoveryAlgorithm(str, Enum):
     """Discovery algorithm options"""
@@ -57,6 +99,57 @@ class DiscoveryResult:
     relevance_match_explanation: str
     diversity_indicators: List[str]
     perspective_type: str
+    diversity_bits: int = 0  # Bitmask form of diversity_indicators
+
+
+@functools.lru_cache(maxsize=8)
+def _make_scorer(algorithm: DiscoveryAlgorithm) -> Callable[[DiscoverySignals], float]:
+    """
+    Build the composite scoring function for an algorithm.
+    
+    The algorithm is fixed for a whole discovery call, so the weight
+    selection happens once here instead of once per claim.
+    """
+    
+    if algorithm == DiscoveryAlgorithm.RELEVANCE:
+        # Heavy emphasis on relevance
+        return lambda s: (
+            s.relevance_score * 0.5 +
+            s.engagement_quality * 0.2 +
+            s.clarity_signal * 0.15 +
+            s.originality_score * 0.1 +
+            s.recency_weight * 0.05
+        )
+    
+    if algorithm == DiscoveryAlgorithm.DIVERSITY:
+        # Emphasize diverse perspectives
+        return lambda s: (
+            s.diversity_score * 0.4 +
+            s.relevance_score * 0.35 +
+            s.engagement_quality * 0.15 +
+            s.originality_score * 0.1
+        )
+    
+    if algorithm == DiscoveryAlgorithm.EMERGENT:
+        # Favor new, original content
+        return lambda s: (
+            s.originality_score * 0.4 +
+            s.recency_weight * 0.25 +
+            s.relevance_score * 0.2 +
+            s.clarity_signal * 0.15
+        )
+    
+    if algorithm == DiscoveryAlgorithm.STANDING_AWARE:
+        # Boost by author standing
+        return lambda s: (
+            s.relevance_score * 0.35 +
+            s.author_standing * 0.3 +
+            s.engagement_quality * 0.2 +
+            s.originality_score * 0.1 +
+            s.diversity_score * 0.05
+        )
+    
+    return lambda s: s.relevance_score
 
 
 class ContentDiscoveryEngine:
@@ -74,6 +167,7 @@ class ContentDiscoveryEngine:
     def __init__(self, api_key: Optional[str] = None):
         self.api_key = api_key or os.environ.get('EMERGENT_LLM_KEY')
         self.session = None
+        self._session_ctr = itertools.count()
     
     async def discover_content(
         self,
@@ -102,22 +196,30 @@ class ContentDiscoveryEngine:
         # Extract user intent and preferences
         intent = await self._analyze_user_intent(user_query)
         
+        # Resolve the scoring formula once for the whole call
+        scorer = _make_scorer(algorithm)
+        
+        # Calculate signals for all claims concurrently
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_SIGNALS)
+        
+        async def bounded_signals(claim: Dict[str, Any]) -> DiscoverySignals:
+            async with semaphore:
+                return await self._calculate_discovery_signals(
+                    claim=claim,
+                    user_intent=intent,
+                    user_standing=user_standing,
+                    diversity_preference=diversity_preference
+                )
+        
+        signals_list = await asyncio.gather(
+            *(bounded_signals(claim) for claim in available_claims)
+        )
+        
         # Score each claim
         results = []
-        for claim in available_claims:
-            signals = await self._calculate_discovery_signals(
-                claim=claim,
-                user_intent=intent,
-                user_standing=user_standing,
-                diversity_preference=diversity_preference
-            )
-            
+        for claim, signals in zip(available_claims, signals_list):
             # Calculate composite score based on algorithm
-            composite_score = self._calculate_composite_score(
-                signals=signals,
-                algorithm=algorithm,
-                diversity_preference=diversity_preference
-            )
+            composite_score = scorer(signals)
             
             result = DiscoveryResult(
                 claim_id=claim['id'],
@@ -127,8 +229,9 @@ class ContentDiscoveryEngine:
                 signals=signals,
                 composite_score=composite_score,
                 relevance_match_explanation=intent.get('query_analysis', ''),
-                diversity_indicators=self._extract_diversity_indicators(claim),
-                perspective_type=claim.get('perspective_type', 'neutral')
+                diversity_indicators=[],
+                perspective_type=claim.get('perspective_type', 'neutral'),
+                diversity_bits=diversity_bits(claim)
             )
             results.append(result)
         
@@ -143,7 +246,12 @@ class ContentDiscoveryEngine:
         elif algorithm == DiscoveryAlgorithm.EMERGENT:
             results = self._apply_emergent_ranking(results)
         
-        return results[:limit]
+        # Materialize indicator labels only for the returned results
+        results = results[:limit]
+        for result in results:
+            result.diversity_indicators = list(_DIV_LABELS[result.diversity_bits])
+        
+        return results
     
     async def _analyze_user_intent(self, query: str) -> Dict[str, Any]:
         """
@@ -165,7 +273,7 @@ class ContentDiscoveryEngine:
             
             chat = LlmChat(
                 api_key=self.api_key,
-                session_id=f"intent-{datetime.now().timestamp()}",
+                session_id=f"intent-{time.monotonic_ns()}-{next(self._session_ctr)}",
                 system_message="""You are an expert query analyzer for Thrryv's content discovery engine.
 Analyze user queries to extract:
 1. Core topic/question they're asking about
@@ -467,45 +575,7 @@ Respond in JSON format:
         Different algorithms weight signals differently.
         """
         
-        if algorithm == DiscoveryAlgorithm.RELEVANCE:
-            # Heavy emphasis on relevance
-            return (
-                signals.relevance_score * 0.5 +
-                signals.engagement_quality * 0.2 +
-                signals.clarity_signal * 0.15 +
-                signals.originality_score * 0.1 +
-                signals.recency_weight * 0.05
-            )
-        
-        elif algorithm == DiscoveryAlgorithm.DIVERSITY:
-            # Emphasize diverse perspectives
-            return (
-                signals.diversity_score * 0.4 +
-                signals.relevance_score * 0.35 +
-                signals.engagement_quality * 0.15 +
-                signals.originality_score * 0.1
-            )
-        
-        elif algorithm == DiscoveryAlgorithm.EMERGENT:
-            # Favor new, original content
-            return (
-                signals.originality_score * 0.4 +
-                signals.recency_weight * 0.25 +
-                signals.relevance_score * 0.2 +
-                signals.clarity_signal * 0.15
-            )
-        
-        elif algorithm == DiscoveryAlgorithm.STANDING_AWARE:
-            # Boost by author standing
-            return (
-                signals.relevance_score * 0.35 +
-                signals.author_standing * 0.3 +
-                signals.engagement_quality * 0.2 +
-                signals.originality_score * 0.1 +
-                signals.diversity_score * 0.05
-            )
-        
-        return signals.relevance_score
+        return _make_scorer(algorithm)(signals)
     
     def _apply_standing_aware_ranking(self, results: List[DiscoveryResult]) -> List[DiscoveryResult]:
         """Apply standing-aware ranking adjustments"""
@@ -554,18 +624,4 @@ Respond in JSON format:
     def _extract_diversity_indicators(self, claim: Dict[str, Any]) -> List[str]:
         """Extract diversity indicators from claim"""
         
-        indicators = []
-        
-        if claim.get('perspective_type') == 'contrarian':
-            indicators.append("contrarian_view")
-        
-        if claim.get('perspective_type') == 'emerging':
-            indicators.append("emerging_perspective")
-        
-        if claim.get('has_citations', False):
-            indicators.append("evidence_based")
-        
-        if claim.get('annotation_diversity_score', 0) > 70:
-            indicators.append("diverse_discussion")
-        
-        return indicators
+        return list(_DIV_LABELS[diversity_bits(claim)])
@@ -10,18 +10,97 @@ Viewers can make quick predictions that:
 """
 
 import os
+import sys
+import time
 import logging
-from typing import Dict, Any, List, Optional
+import functools
+from typing import Dict, Any, List, Mapping, Optional, Tuple
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
 from enum import Enum
+from types import MappingProxyType
 import uuid
+import numpy as np
 from dotenv import load_dotenv
 
 load_dotenv()
 
 logger = logging.getLogger(__name__)
 
+# Number of predictors returned on the leaderboard
+LEADERBOARD_SIZE = 10
+
+
+@functools.lru_cache(maxsize=8192)
+def _parse_iso(value: str) -> datetime:
+    """Parse an ISO timestamp, memoized since challenge times never change"""
+    return datetime.fromisoformat(value)
+
+
+@functools.lru_cache(maxsize=8192)
+def _iso_to_epoch(value: str) -> float:
+    """POSIX timestamp for an ISO string, for cheap float comparisons"""
+    return _parse_iso(value).timestamp()
+
+
+@functools.lru_cache(maxsize=1024)
+def _tokens(text: str) -> frozenset:
+    """Lowercased word set of a prediction/outcome, memoized across calls"""
+    return frozenset(text.lower().split())
+
+
+# Options offered when a challenge does not define its own
+DEFAULT_OPTIONS = ('Yes', 'No', 'Unsure')
+
+# Outcome/prediction values shared by most records, checked before sys.intern:
+# the default option labels and the auto-resolution outcome
+_INTERNED_VALUES = {v: sys.intern(v) for v in (*DEFAULT_OPTIONS, 'not_resolved')}
+
+
+def _intern(value: str) -> str:
+    """Canonical copy of a short prediction/outcome string"""
+    interned = _INTERNED_VALUES.get(value)
+    if interned is not None:
+        return interned
+    return sys.intern(value) if type(value) is str else value
+
+
+ENGAGEMENT_NOTE = "Make a quick prediction to engage with this content. Your engagement only affects your standing, not this content."
+
+
+@functools.lru_cache(maxsize=4096)
+def _public_view(
+    challenge_id: str,
+    title: str,
+    description: str,
+    challenge_type: str,
+    options: Tuple[str, ...],
+    status: str,
+    closes_at: str,
+    bucket_sec: int
+) -> Mapping[str, Any]:
+    """
+    Viewer-independent part of a displayed challenge.
+    
+    Keyed on every field it renders plus the current whole second, so a hot
+    challenge is built once per second however many viewers load it. The
+    view is shared by every caller, so it is read-only and holds only
+    immutable values (options stay a tuple).
+    """
+    
+    time_remaining = _iso_to_epoch(closes_at) - bucket_sec
+    
+    return MappingProxyType({
+        "id": challenge_id,
+        "title": title,
+        "description": description,
+        "type": challenge_type,
+        "options": options,
+        "status": status,
+        "is_open": time_remaining > 0,
+        "time_remaining_seconds": max(0, int(time_remaining)),
+    })
+
 
 class ChallengeStatus(str, Enum):
     """Status of a challenge"""
@@ -31,7 +110,7 @@ class ChallengeStatus(str, Enum):
     EXPIRED = "expired"
 
 
-@dataclass
+@dataclass(slots=True)
 class ChallengePrediction:
     """A single prediction on a challenge"""
     id: str
@@ -42,9 +121,14 @@ class ChallengePrediction:
     made_at: str
     points_earned: Optional[float] = None
     feedback: Optional[str] = None
+    
+    def __post_init__(self):
+        # Interned so leaderboard/scoring equality checks hit the identity
+        # fast path and repeated values share one string object
+        self.prediction = _intern(self.prediction)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ChallengeResolution:
     """Resolution of a challenge after it closes"""
     challenge_id: str
@@ -53,9 +137,12 @@ class ChallengeResolution:
     resolution_explanation: str
     community_accuracy: float  # What % predicted correctly
     engagement_metrics: Dict[str, Any]
+    
+    def __post_init__(self):
+        object.__setattr__(self, 'actual_outcome', _intern(self.actual_outcome))
 
 
-@dataclass
+@dataclass(slots=True)
 class Challenge:
     """Interactive challenge within content"""
     id: str
@@ -74,6 +161,35 @@ class Challenge:
     points_per_prediction: float
 
 
+def _to_soa(
+    prediction_records: List[ChallengePrediction],
+    resolutions: List[ChallengeResolution]
+) -> Tuple[List[str], np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Lay prediction records out as parallel arrays for vectorized aggregation.
+    
+    Returns (user_ids, user_code, confidence, correct) where user_ids is in
+    first-appearance order and user_code indexes into it per prediction.
+    """
+    outcome_by_challenge = {res.challenge_id: res.actual_outcome for res in resolutions}
+    user_index: Dict[str, int] = {}
+    n = len(prediction_records)
+    
+    user_code = np.fromiter(
+        (user_index.setdefault(p.user_id, len(user_index)) for p in prediction_records),
+        dtype=np.intp, count=n
+    )
+    confidence = np.fromiter(
+        (p.confidence_level for p in prediction_records), dtype=np.float64, count=n
+    )
+    correct = np.fromiter(
+        (outcome_by_challenge.get(p.challenge_id) == p.prediction for p in prediction_records),
+        dtype=np.bool_, count=n
+    )
+    
+    return list(user_index), user_code, confidence, correct
+
+
 class InteractiveChallengeSystem:
     """
     Manages interactive challenge predictions.
@@ -92,6 +208,9 @@ class InteractiveChallengeSystem:
         self.points_correct = 5.0
         self.points_close = 2.5
         self.points_attempt = 1.0
+        self._default_duration_td = timedelta(hours=self.default_duration_hours)
+        self._default_resolve_td = timedelta(hours=self.default_resolve_hours)
+        self._default_options = DEFAULT_OPTIONS
     
     async def create_challenge(
         self,
@@ -118,23 +237,25 @@ class InteractiveChallengeSystem:
             Created challenge
         """
         
-        challenge_id = str(uuid.uuid4())
         now = datetime.now(timezone.utc)
         
-        duration = challenge_data.get('duration_hours', self.default_duration_hours)
-        resolve = challenge_data.get('resolve_hours', self.default_resolve_hours)
+        duration = challenge_data.get('duration_hours')
+        duration_td = self._default_duration_td if duration is None else timedelta(hours=duration)
+        resolve = challenge_data.get('resolve_hours')
+        resolve_td = self._default_resolve_td if resolve is None else timedelta(hours=resolve)
+        options = challenge_data.get('options')
         
         challenge = Challenge(
-            id=challenge_id,
+            id=str(uuid.uuid4()),
             claim_id=claim_id,
             creator_id=creator_id,
             title=challenge_data.get('title', ''),
             description=challenge_data.get('description', ''),
             challenge_type=challenge_data.get('challenge_type', 'yes_no'),
-            options=challenge_data.get('options', ['Yes', 'No', 'Unsure']),
+            options=list(self._default_options) if options is None else options,
             created_at=now.isoformat(),
-            closes_at=(now + timedelta(hours=duration)).isoformat(),
-            resolve_at=(now + timedelta(hours=resolve)).isoformat(),
+            closes_at=(now + duration_td).isoformat(),
+            resolve_at=(now + resolve_td).isoformat(),
             status=ChallengeStatus.ACTIVE,
             prediction_count=0,
             participant_count=0,
@@ -256,8 +377,7 @@ class InteractiveChallengeSystem:
         
         # Simple similarity check
         if len(prediction) > 3 and len(outcome) > 3:
-            common_words = set(prediction.lower().split()) & set(outcome.lower().split())
-            return len(common_words) > 0
+            return not _tokens(prediction).isdisjoint(_tokens(outcome))
         
         return False
     
@@ -292,48 +412,47 @@ class InteractiveChallengeSystem:
         Shows engagement without ranking.
         """
         
-        # Calculate accuracy
-        correct_predictions = 0
-        for pred in prediction_records:
-            for res in resolutions:
-                if pred.challenge_id == res.challenge_id:
-                    if pred.prediction == res.actual_outcome:
-                        correct_predictions += 1
-        
-        accuracy_rate = (correct_predictions / len(prediction_records)) if prediction_records else 0
-        
-        # Top predictors (by confidence and correctness)
-        predictor_scores = {}
-        for pred in prediction_records:
-            if pred.user_id not in predictor_scores:
-                predictor_scores[pred.user_id] = {
-                    'count': 0,
-                    'confidence_avg': 0,
-                    'correct': 0
-                }
-            
-            predictor_scores[pred.user_id]['count'] += 1
-            predictor_scores[pred.user_id]['confidence_avg'] += pred.confidence_level
-            
-            for res in resolutions:
-                if pred.challenge_id == res.challenge_id and pred.prediction == res.actual_outcome:
-                    predictor_scores[pred.user_id]['correct'] += 1
+        if not prediction_records:
+            return {
+                "total_predictions": 0,
+                "unique_participants": 0,
+                "accuracy_rate": 0,
+                "average_confidence": 0,
+                "top_predictors": []
+            }
         
-        # Calculate confidence averages
-        for user_id in predictor_scores:
-            count = predictor_scores[user_id]['count']
-            predictor_scores[user_id]['confidence_avg'] /= count
+        user_ids, user_code, confidence, correct = _to_soa(prediction_records, resolutions)
+        total = len(prediction_records)
+        
+        # Per-user aggregates over the struct-of-arrays layout
+        counts = np.bincount(user_code)
+        conf_avg = np.bincount(user_code, weights=confidence) / counts
+        correct_sum = np.bincount(user_code, weights=correct).astype(np.int64)
+        
+        # Top predictors (by correctness, then confidence). Partition on the
+        # correct count first so only plausible candidates get fully sorted;
+        # lexsort is stable, so ties keep first-appearance order.
+        candidates = np.arange(len(user_ids))
+        if len(user_ids) > LEADERBOARD_SIZE:
+            kth = np.partition(correct_sum, -LEADERBOARD_SIZE)[-LEADERBOARD_SIZE]
+            candidates = np.flatnonzero(correct_sum >= kth)
+        order = candidates[np.lexsort((-conf_avg[candidates], -correct_sum[candidates]))]
+        
+        top_predictors = [
+            (user_ids[i], {
+                'count': int(counts[i]),
+                'confidence_avg': float(conf_avg[i]),
+                'correct': int(correct_sum[i])
+            })
+            for i in order[:LEADERBOARD_SIZE]
+        ]
         
         return {
-            "total_predictions": len(prediction_records),
-            "unique_participants": len(predictor_scores),
-            "accuracy_rate": accuracy_rate,
-            "average_confidence": sum(p.confidence_level for p in prediction_records) / len(prediction_records) if prediction_records else 0,
-            "top_predictors": sorted(
-                predictor_scores.items(),
-                key=lambda x: (x[1]['correct'], x[1]['confidence_avg']),
-                reverse=True
-            )[:10]
+            "total_predictions": total,
+            "unique_participants": len(user_ids),
+            "accuracy_rate": int(np.count_nonzero(correct)) / total,
+            "average_confidence": sum(confidence.tolist()) / total,
+            "top_predictors": top_predictors
         }
     
     def format_challenge_for_display(
@@ -345,31 +464,29 @@ class InteractiveChallengeSystem:
         Format challenge for frontend display.
         """
         
-        now = datetime.now(timezone.utc)
-        closes_at = datetime.fromisoformat(challenge.closes_at)
-        
-        time_remaining = closes_at - now
-        is_open = time_remaining.total_seconds() > 0
+        view = _public_view(
+            challenge.id,
+            challenge.title,
+            challenge.description,
+            challenge.challenge_type,
+            tuple(challenge.options),
+            challenge.status.value,
+            challenge.closes_at,
+            int(time.time())
+        )
         
         return {
-            "id": challenge.id,
-            "title": challenge.title,
-            "description": challenge.description,
-            "type": challenge.challenge_type,
-            "options": challenge.options,
-            "status": challenge.status.value,
-            "is_open": is_open,
-            "time_remaining_seconds": max(0, int(time_remaining.total_seconds())),
+            **view,
             "participation_stats": {
                 "predictions": challenge.prediction_count,
                 "participants": challenge.participant_count
             },
             "your_prediction": {
-                "prediction": user_prediction.prediction if user_prediction else None,
-                "confidence": user_prediction.confidence_level if user_prediction else None,
-                "made_at": user_prediction.made_at if user_prediction else None
+                "prediction": user_prediction.prediction,
+                "confidence": user_prediction.confidence_level,
+                "made_at": user_prediction.made_at
             } if user_prediction else None,
-            "engagement_note": "Make a quick prediction to engage with this content. Your engagement only affects your standing, not this content."
+            "engagement_note": ENGAGEMENT_NOTE
         }
     
     async def auto_resolve_expired_challenges(
@@ -383,17 +500,17 @@ class InteractiveChallengeSystem:
         """
         
         now = datetime.now(timezone.utc)
+        now_ts = now.timestamp()
+        now_iso = now.isoformat()
         resolutions = []
         
         for challenge in challenges:
-            resolve_at = datetime.fromisoformat(challenge.resolve_at)
-            
-            if now > resolve_at and challenge.status == ChallengeStatus.CLOSED:
+            if challenge.status == ChallengeStatus.CLOSED and now_ts > _iso_to_epoch(challenge.resolve_at):
                 # Auto-expire without resolution
                 resolution = ChallengeResolution(
                     challenge_id=challenge.id,
                     actual_outcome="not_resolved",
-                    resolution_timestamp=now.isoformat(),
+                    resolution_timestamp=now_iso,
                     resolution_explanation="Challenge expired without manual resolution",
                     community_accuracy=0.0,
                     engagement_metrics={
@@ -2,19 +2,55 @@
 Centralized logging configuration for Thrryv
 Provides structured logging with different levels and handlers
 """
+import atexit
 import logging
+import logging.handlers
+import queue
 import sys
+import time
 from datetime import datetime
 from pathlib import Path
 import json
 
+try:
+    import orjson
+    
+    def _dumps(data) -> str:
+        return orjson.dumps(data).decode()
+except ImportError:
+    _dumps = json.dumps
+
+
+# Rotation limits for the JSON log files
+LOG_MAX_BYTES = 100 * 1024 * 1024
+LOG_BACKUP_COUNT = 10
+
+# Request context attributes copied from `extra` into JSON records
+_EXTRA_FIELDS = ('user_id', 'claim_id', 'request_id')
+_MISSING = object()
+
 
 class JSONFormatter(logging.Formatter):
     """Format logs as JSON for better parsing and analysis"""
     
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # (whole second, ISO prefix) of the last record, swapped as one tuple
+        # so concurrent handlers never see a mismatched pair
+        self._second_cache = (None, "")
+    
+    def _timestamp(self, created: float) -> str:
+        """UTC ISO timestamp for a record, reusing the prefix within a second"""
+        sec = int(created)
+        cached_sec, prefix = self._second_cache
+        if sec != cached_sec:
+            prefix = time.strftime('%Y-%m-%dT%H:%M:%S', time.gmtime(sec))
+            self._second_cache = (sec, prefix)
+        return f"{prefix}.{int((created - sec) * 1e6):06d}"
+    
     def format(self, record):
         log_data = {
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": self._timestamp(record.created),
             "level": record.levelname,
             "logger": record.name,
             "message": record.getMessage(),
@@ -23,19 +59,20 @@ class JSONFormatter(logging.Formatter):
             "line": record.lineno
         }
         
-        # Add exception info if present
+        # Add exception info if present, reusing the text another formatter
+        # (e.g. the console one) already cached on the record
         if record.exc_info:
-            log_data["exception"] = self.formatException(record.exc_info)
+            if not record.exc_text:
+                record.exc_text = self.formatException(record.exc_info)
+            log_data["exception"] = record.exc_text
         
         # Add extra fields if present
-        if hasattr(record, 'user_id'):
-            log_data["user_id"] = record.user_id
-        if hasattr(record, 'claim_id'):
-            log_data["claim_id"] = record.claim_id
-        if hasattr(record, 'request_id'):
-            log_data["request_id"] = record.request_id
+        for attr in _EXTRA_FIELDS:
+            value = getattr(record, attr, _MISSING)
+            if value is not _MISSING:
+                log_data[attr] = value
         
-        return json.dumps(log_data)
+        return _dumps(log_data)
 
 
 class ColoredFormatter(logging.Formatter):
@@ -50,10 +87,99 @@ class ColoredFormatter(logging.Formatter):
     }
     RESET = '\033[0m'
     
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._colored = {
+            getattr(logging, name): f"{color}{name}{self.RESET}"
+            for name, color in self.COLORS.items()
+        }
+    
     def format(self, record):
-        log_color = self.COLORS.get(record.levelname, self.RESET)
-        record.levelname = f"{log_color}{record.levelname}{self.RESET}"
-        return super().format(record)
+        # Swap in the colored name only for this formatter; the record is
+        # shared with the JSON file handlers, which must see the plain name
+        original = record.levelname
+        record.levelname = self._colored.get(
+            record.levelno, f"{self.RESET}{original}{self.RESET}"
+        )
+        try:
+            return super().format(record)
+        finally:
+            record.levelname = original
+
+
+class BufferedRotatingFileHandler(logging.handlers.RotatingFileHandler):
+    """
+    Size-rotated file handler that writes through a large buffer.
+    
+    Records are flushed to disk only at flush_level and above (or on close),
+    so bursts of INFO/DEBUG lines cost one write syscall per buffer instead
+    of one per record. The running file size is tracked in memory, which
+    avoids the seek/tell and the second format() the stock rollover check
+    does per record; it counts characters, so maxBytes is approximate for
+    non-ASCII logs.
+    """
+    
+    def __init__(self, filename, buffer_size: int = 64 * 1024,
+                 flush_level: int = logging.WARNING, **kwargs):
+        self.buffer_size = buffer_size
+        self.flush_level = flush_level
+        self._size = 0
+        super().__init__(filename, **kwargs)
+    
+    def _open(self):
+        stream = open(self.baseFilename, self.mode, buffering=self.buffer_size,
+                      encoding=self.encoding, errors=self.errors)
+        self._size = stream.tell()
+        return stream
+    
+    def emit(self, record):
+        try:
+            msg = self.format(record) + self.terminator
+            if self.stream is None:
+                self.stream = self._open()
+            if self.maxBytes > 0 and self._size and self._size + len(msg) >= self.maxBytes:
+                self.doRollover()
+            self.stream.write(msg)
+            self._size += len(msg)
+            if record.levelno >= self.flush_level:
+                self.stream.flush()
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+
+class _LocalQueueHandler(logging.handlers.QueueHandler):
+    """
+    Enqueue records untouched.
+    
+    The listener runs in this process, so there is nothing to pickle and the
+    stock prepare() step (which pre-formats the message and drops exc_info)
+    would only stop the JSON formatter from seeing the original record.
+    """
+    
+    def emit(self, record):
+        try:
+            self.enqueue(record)
+        except Exception:
+            self.handleError(record)
+
+
+# Background listener that runs the real handlers off the calling thread
+_listener = None
+
+
+def _stop_listener():
+    """Flush queued records and stop the background listener"""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        for handler in _listener.handlers:
+            handler.close()
+        _listener = None
+
+
+atexit.register(_stop_listener)
 
 
 def setup_logging(log_dir: Path = None, log_level: str = "INFO"):
@@ -72,6 +198,9 @@ def setup_logging(log_dir: Path = None, log_level: str = "INFO"):
     
     # Remove existing handlers
     root_logger.handlers.clear()
+    _stop_listener()
+    
+    handlers = []
     
     # Console handler with colored output
     console_handler = logging.StreamHandler(sys.stdout)
@@ -81,7 +210,7 @@ def setup_logging(log_dir: Path = None, log_level: str = "INFO"):
         datefmt='%Y-%m-%d %H:%M:%S'
     )
     console_handler.setFormatter(console_formatter)
-    root_logger.addHandler(console_handler)
+    handlers.append(console_handler)
     
     # File handler with JSON format (if log_dir provided)
     if log_dir:
@@ -89,18 +218,30 @@ def setup_logging(log_dir: Path = None, log_level: str = "INFO"):
         
         # Application log
         app_log_file = log_dir / f"thrryv_{datetime.now().strftime('%Y%m%d')}.log"
-        file_handler = logging.FileHandler(app_log_file, encoding='utf-8')
+        file_handler = BufferedRotatingFileHandler(
+            app_log_file, maxBytes=LOG_MAX_BYTES, backupCount=LOG_BACKUP_COUNT, encoding='utf-8'
+        )
         file_handler.setLevel(logging.DEBUG)  # Log everything to file
         json_formatter = JSONFormatter()
         file_handler.setFormatter(json_formatter)
-        root_logger.addHandler(file_handler)
+        handlers.append(file_handler)
         
         # Error log (separate file for errors only)
         error_log_file = log_dir / f"thrryv_errors_{datetime.now().strftime('%Y%m%d')}.log"
-        error_handler = logging.FileHandler(error_log_file, encoding='utf-8')
+        error_handler = BufferedRotatingFileHandler(
+            error_log_file, maxBytes=LOG_MAX_BYTES, backupCount=LOG_BACKUP_COUNT, encoding='utf-8'
+        )
         error_handler.setLevel(logging.ERROR)
         error_handler.setFormatter(json_formatter)
-        root_logger.addHandler(error_handler)
+        handlers.append(error_handler)
+    
+    # Handlers run on the listener thread so console/file writes never block
+    # the emitting (request) thread
+    global _listener
+    log_queue = queue.SimpleQueue()
+    _listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+    _listener.start()
+    root_logger.addHandler(_LocalQueueHandler(log_queue))
     
     # Set third-party loggers to WARNING to reduce noise
     logging.getLogger('urllib3').setLevel(logging.WARNING)
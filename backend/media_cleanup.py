@@ -3,14 +3,189 @@ Media file cleanup utilities for Thrryv
 Handles orphaned files and cleanup when claims/users are deleted
 """
 import os
+import asyncio
 import logging
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
 from pathlib import Path
 from datetime import datetime, timedelta
-from typing import List, Set
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple
 from motor.motor_asyncio import AsyncIOMotorClient
+from pymongo import DeleteMany
 
 logger = logging.getLogger(__name__)
 
+# Threads used to overlap unlink syscalls when deleting many files
+UNLINK_WORKERS = 16
+# Unlinks queued ahead of the pool while scanning, bounding memory
+MAX_PENDING_UNLINKS = UNLINK_WORKERS * 4
+
+# Media IDs per $in clause when deleting records, keeping each command well
+# under MongoDB's 16MB BSON limit
+DELETE_BATCH_SIZE = 1000
+
+
+def _chunked(items: Iterable[str], size: int):
+    """Yield lists of at most `size` items"""
+    it = iter(items)
+    while True:
+        chunk = list(islice(it, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+async def _delete_media_records(db, media_ids: Iterable[str]) -> int:
+    """Delete media records by ID in bounded batches, returning the count"""
+    requests = [
+        DeleteMany({"id": {"$in": batch}})
+        for batch in _chunked(media_ids, DELETE_BATCH_SIZE)
+    ]
+    if not requests:
+        return 0
+    result = await db.media.bulk_write(requests, ordered=False)
+    return result.deleted_count
+
+
+def _iter_orphaned_files(upload_dir: Path, referenced_media_ids: Set[str]) -> Iterator[Path]:
+    """Yield files in the upload directory whose media ID is not referenced"""
+    with os.scandir(upload_dir) as entries:
+        for entry in entries:
+            if entry.is_file():
+                # Extract media ID from filename (same stem rule as Path.stem)
+                name = entry.name
+                dot = name.rfind('.')
+                stem = name[:dot] if 0 < dot < len(name) - 1 else name
+                media_id = stem[8:] if stem.startswith('profile_') else stem
+                
+                # Check if this file is referenced
+                if media_id not in referenced_media_ids:
+                    yield Path(entry.path)
+
+
+def _unlink_file(file_path: Path) -> bool:
+    """Delete one orphaned file, logging rather than raising on failure"""
+    try:
+        file_path.unlink()
+        logger.debug(f"Deleted orphaned file: {file_path}")
+        return True
+    except Exception as e:
+        logger.error(f"Failed to delete {file_path}: {e}")
+        return False
+
+
+def _delete_orphaned_files(upload_dir: Path, referenced_media_ids: Set[str]) -> Tuple[int, int]:
+    """
+    Unlink unreferenced files while the directory is being scanned.
+    
+    Unlinks run on a thread pool with a bounded number in flight, so memory
+    stays constant however many orphans there are.
+    
+    Returns:
+        (orphaned files found, files deleted)
+    """
+    found = 0
+    deleted = 0
+    pending = deque()
+    with ThreadPoolExecutor(max_workers=UNLINK_WORKERS) as pool:
+        for file_path in _iter_orphaned_files(upload_dir, referenced_media_ids):
+            found += 1
+            if len(pending) >= MAX_PENDING_UNLINKS:
+                deleted += pending.popleft().result()
+            pending.append(pool.submit(_unlink_file, file_path))
+        
+        for future in pending:
+            deleted += future.result()
+    return found, deleted
+
+
+def _unlink_media_file(file_path: Optional[str]) -> bool:
+    """
+    Delete a media record's file if it is still on disk.
+    
+    Returns False only when the file exists but could not be removed, in
+    which case its record should be kept.
+    """
+    if not file_path:
+        return True
+    try:
+        Path(file_path).unlink()
+        logger.debug(f"Deleted media file: {file_path}")
+    except FileNotFoundError:
+        pass
+    except Exception as e:
+        logger.error(f"Failed to delete media file {file_path}: {e}")
+        return False
+    return True
+
+
+def _unlink_media_files(file_paths: List[Optional[str]]) -> List[bool]:
+    """Delete media records' files on a thread pool, one result per path"""
+    with ThreadPoolExecutor(max_workers=UNLINK_WORKERS) as pool:
+        return list(pool.map(_unlink_media_file, file_paths))
+
+
+async def _delete_media(db, media: List[Tuple[str, Optional[str]]]) -> int:
+    """
+    Delete (media ID, file path) pairs: files in parallel off the event loop,
+    then the records whose files are gone in batched deletes.
+    """
+    if not media:
+        return 0
+    removed = await asyncio.to_thread(_unlink_media_files, [path for _, path in media])
+    return await _delete_media_records(
+        db, (media_id for (media_id, _), ok in zip(media, removed) if ok)
+    )
+
+
+def _scan_storage(upload_dir: Path) -> Tuple[int, int]:
+    """Count files and total bytes in the upload directory"""
+    total_files = 0
+    total_size = 0
+    with os.scandir(upload_dir) as entries:
+        for entry in entries:
+            if entry.is_file():
+                total_files += 1
+                total_size += entry.stat().st_size
+    return total_files, total_size
+
+
+async def _claim_media_ids(db) -> Set[str]:
+    """Media IDs referenced by any claim"""
+    # The server unwinds and deduplicates the ids so only one small
+    # document per unique media id crosses the wire
+    media_ids: Set[str] = set()
+    async for doc in db.claims.aggregate([
+        {"$unwind": "$media_ids"},
+        {"$group": {"_id": "$media_ids"}},
+    ]):
+        media_ids.add(doc['_id'])
+    return media_ids
+
+
+async def _profile_media_ids(db) -> Set[str]:
+    """Media IDs used as user profile pictures"""
+    media_ids: Set[str] = set()
+    users = db.users.find(
+        {"profile_picture": {"$nin": [None, ""]}},
+        {"_id": 0, "profile_picture": 1}
+    )
+    async for user in users:
+        if user.get('profile_picture'):
+            # Extract ID from file path
+            profile_pic_path = Path(user['profile_picture'])
+            media_ids.add(profile_pic_path.stem.replace('profile_', ''))
+    return media_ids
+
+
+async def _media_file_paths(db) -> Dict[str, str]:
+    """File path of every media record, keyed by media ID"""
+    media_file_paths: Dict[str, str] = {}
+    async for m in db.media.find({}, {"_id": 0, "id": 1, "file_path": 1}):
+        media_file_paths[m['id']] = m['file_path']
+    return media_file_paths
+
 
 async def cleanup_orphaned_media(db, upload_dir: Path) -> dict:
     """
@@ -25,65 +200,34 @@ async def cleanup_orphaned_media(db, upload_dir: Path) -> dict:
     """
     logger.info("Starting orphaned media cleanup")
     
-    # Get all referenced media IDs from database
-    referenced_media_ids: Set[str] = set()
-    
-    # Get media from claims
-    claims = await db.claims.find({}, {"_id": 0, "media_ids": 1}).to_list(length=100000)
-    for claim in claims:
-        referenced_media_ids.update(claim.get('media_ids', []))
+    # Collect claim references, profile picture references and media
+    # records concurrently; the three queries are independent
+    claim_media_ids, profile_media_ids, media_file_paths = await asyncio.gather(
+        _claim_media_ids(db),
+        _profile_media_ids(db),
+        _media_file_paths(db)
+    )
     
-    # Get media from users (profile pictures)
-    users = await db.users.find({}, {"_id": 0, "profile_picture": 1}).to_list(length=100000)
-    for user in users:
-        if user.get('profile_picture'):
-            # Extract ID from file path
-            profile_pic_path = Path(user['profile_picture'])
-            media_id = profile_pic_path.stem.replace('profile_', '')
-            referenced_media_ids.add(media_id)
-    
-    # Get all media records from database
-    all_media = await db.media.find({}, {"_id": 0, "id": 1, "file_path": 1}).to_list(length=100000)
-    db_media_ids = {m['id'] for m in all_media}
-    media_file_paths = {m['id']: m['file_path'] for m in all_media}
+    referenced_media_ids: Set[str] = claim_media_ids | profile_media_ids
+    db_media_ids = media_file_paths.keys()
     
     # Find orphaned media in database
     orphaned_db_media = db_media_ids - referenced_media_ids
     
-    # Find orphaned files in filesystem
-    orphaned_files: List[Path] = []
     deleted_files = 0
     deleted_db_records = 0
-    
-    # Check filesystem for unreferenced files
-    if upload_dir.exists():
-        for file_path in upload_dir.iterdir():
-            if file_path.is_file():
-                # Extract media ID from filename
-                stem = file_path.stem
-                if stem.startswith('profile_'):
-                    media_id = stem.replace('profile_', '')
-                else:
-                    media_id = stem
-                
-                # Check if this file is referenced
-                if media_id not in referenced_media_ids:
-                    orphaned_files.append(file_path)
+    orphaned_files_found = 0
     
     # Delete orphaned database records
     if orphaned_db_media:
-        result = await db.media.delete_many({"id": {"$in": list(orphaned_db_media)}})
-        deleted_db_records = result.deleted_count
+        deleted_db_records = await _delete_media_records(db, orphaned_db_media)
         logger.info(f"Deleted {deleted_db_records} orphaned media records from database")
     
-    # Delete orphaned files
-    for file_path in orphaned_files:
-        try:
-            file_path.unlink()
-            deleted_files += 1
-            logger.debug(f"Deleted orphaned file: {file_path}")
-        except Exception as e:
-            logger.error(f"Failed to delete {file_path}: {e}")
+    # Delete unreferenced files as the filesystem is scanned (off the event loop)
+    if upload_dir.exists():
+        orphaned_files_found, deleted_files = await asyncio.to_thread(
+            _delete_orphaned_files, upload_dir, referenced_media_ids
+        )
     
     logger.info(f"Cleanup complete: {deleted_files} files and {deleted_db_records} DB records deleted")
     
@@ -92,7 +236,7 @@ async def cleanup_orphaned_media(db, upload_dir: Path) -> dict:
         "deleted_db_records": deleted_db_records,
         "total_media_in_db": len(db_media_ids),
         "referenced_media": len(referenced_media_ids),
-        "orphaned_found": len(orphaned_db_media) + len(orphaned_files)
+        "orphaned_found": len(orphaned_db_media) + orphaned_files_found
     }
 
 
@@ -108,29 +252,19 @@ async def delete_media_files(media_ids: List[str], db, upload_dir: Path) -> int:
     Returns:
         Number of files successfully deleted
     """
-    deleted_count = 0
-    
-    for media_id in media_ids:
-        try:
-            # Get media record
-            media = await db.media.find_one({"id": media_id}, {"_id": 0})
-            if not media:
-                continue
-            
-            # Delete file from filesystem
-            file_path = Path(media['file_path'])
-            if file_path.exists():
-                file_path.unlink()
-                logger.debug(f"Deleted media file: {file_path}")
-            
-            # Delete database record
-            await db.media.delete_one({"id": media_id})
-            deleted_count += 1
-            
-        except Exception as e:
-            logger.error(f"Failed to delete media {media_id}: {e}")
-    
-    return deleted_count
+    if not media_ids:
+        return 0
+    
+    # Fetch every record's file path in one round-trip
+    media = [
+        (m['id'], m.get('file_path'))
+        async for m in db.media.find(
+            {"id": {"$in": list(media_ids)}},
+            {"_id": 0, "id": 1, "file_path": 1}
+        )
+    ]
+    
+    return await _delete_media(db, media)
 
 
 async def cleanup_old_media(db, upload_dir: Path, days_old: int = 90) -> dict:
@@ -149,32 +283,42 @@ async def cleanup_old_media(db, upload_dir: Path, days_old: int = 90) -> dict:
     
     cutoff_date = datetime.now() - timedelta(days=days_old)
     
-    # Find old media records
-    old_media = await db.media.find({
-        "created_at": {"$lt": cutoff_date.isoformat()}
-    }, {"_id": 0, "id": 1}).to_list(length=100000)
-    
-    old_media_ids = [m['id'] for m in old_media]
-    
-    # Check which ones are still referenced
-    referenced = set()
-    
-    claims = await db.claims.find({
-        "media_ids": {"$in": old_media_ids}
-    }, {"_id": 0, "media_ids": 1}).to_list(length=100000)
-    
-    for claim in claims:
-        referenced.update(claim.get('media_ids', []))
+    # Find old media records and whether any claim still references them in
+    # a single round-trip; the joined claims never leave the server
+    old_media = db.media.aggregate([
+        {"$match": {"created_at": {"$lt": cutoff_date.isoformat()}}},
+        {"$lookup": {
+            "from": "claims",
+            "localField": "id",
+            "foreignField": "media_ids",
+            "as": "refs"
+        }},
+        {"$project": {
+            "_id": 0,
+            "id": 1,
+            "file_path": 1,
+            "referenced": {"$gt": [{"$size": "$refs"}, 0]}
+        }}
+    ])
+    
+    total_old_media = 0
+    still_referenced = 0
+    unreferenced_old: List[Tuple[str, Optional[str]]] = []
+    async for media in old_media:
+        total_old_media += 1
+        if media['referenced']:
+            still_referenced += 1
+        else:
+            unreferenced_old.append((media['id'], media.get('file_path')))
     
     # Delete unreferenced old media
-    unreferenced_old = [mid for mid in old_media_ids if mid not in referenced]
-    deleted = await delete_media_files(unreferenced_old, db, upload_dir)
+    deleted = await _delete_media(db, unreferenced_old)
     
     logger.info(f"Deleted {deleted} old unreferenced media files")
     
     return {
-        "total_old_media": len(old_media_ids),
-        "still_referenced": len(referenced),
+        "total_old_media": total_old_media,
+        "still_referenced": still_referenced,
         "deleted": deleted
     }
 
@@ -190,10 +334,7 @@ async def get_storage_stats(db, upload_dir: Path) -> dict:
     total_size = 0
     
     if upload_dir.exists():
-        for file_path in upload_dir.iterdir():
-            if file_path.is_file():
-                total_files += 1
-                total_size += file_path.stat().st_size
+        total_files, total_size = await asyncio.to_thread(_scan_storage, upload_dir)
     
     media_count = await db.media.count_documents({})
     
@@ -11,19 +11,262 @@ Supports:
 """
 
 import os
+import time
+import heapq
+import uuid
 import logging
-from typing import Dict, Any, List, Optional
+import functools
+from collections import OrderedDict
+from typing import Dict, Any, List, Optional, Tuple
 from dataclasses import dataclass
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta, timezone
+import math
 import json
+import numpy as np
 from dotenv import load_dotenv
 
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads
+
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
 load_dotenv()
 
 logger = logging.getLogger(__name__)
 
+# Keyword tables for fallback intent parsing (substring matches against the
+# lowercased query). Dict order is the order preferences/domains are listed.
+PERSPECTIVE_KEYWORDS = {
+    "diverse": ("different", "diverse", "other", "perspectives", "viewpoints"),
+    "mainstream": ("mainstream", "popular", "consensus", "most people"),
+    "critical": ("critical", "against", "opposition", "disagree"),
+    "expert": ("expert", "research", "study", "scientific"),
+}
+DEPTH_KEYWORDS = {
+    "surface": ("briefly", "overview", "quick", "summary"),
+    "deep": ("deep", "detail", "comprehensive", "thorough", "explain in depth"),
+}
+SORT_KEYWORDS = {
+    "recency": ("recent", "latest", "new"),
+    "originality": ("original", "novel", "unique"),
+}
+# Time spans in priority order, with how many days back each reaches
+# (None: explicitly no time constraint)
+TIME_RANGE_KEYWORDS = {
+    "day": ("today", "yesterday"),
+    "week": ("this week", "last week", "past week"),
+    "month": ("this month", "last month", "past month"),
+    "year": ("this year", "past year", "last year"),
+    "all": ("historical", "all time", "anytime"),
+}
+TIME_RANGE_DAYS = {"day": 1, "week": 7, "month": 30, "year": 365, "all": None}
+QUALITY_KEYWORDS = ("quality", "well-researched", "credible", "authoritative")
+DOMAIN_KEYWORDS = {
+    "Science": ("science", "research", "study", "experiment", "scientific", "physics", "biology", "chemistry"),
+    "Health": ("health", "medical", "disease", "vaccine", "wellness", "doctor", "hospital"),
+    "Technology": ("technology", "tech", "AI", "computer", "software", "digital", "innovation"),
+    "Politics": ("political", "government", "election", "policy", "vote", "president", "congress"),
+    "Economics": ("economy", "economic", "financial", "market", "business", "trade", "wealth"),
+    "Environment": ("environment", "climate", "pollution", "renewable", "sustainability"),
+    "History": ("history", "historical", "ancient", "past", "century", "war", "empire"),
+    "Society": ("social", "society", "culture", "community", "demographic", "equality"),
+    "Sports": ("sport", "athletic", "game", "competition", "player", "team", "championship"),
+    "Entertainment": ("movie", "music", "celebrity", "actor", "entertainment", "film"),
+}
+
+SEARCH_INTENT_SYSTEM_MSG = """You are a search intent analyzer for Thrryv.
+Convert natural language search queries into structured intent.
+
+Available domains: Science, Health, Technology, Politics, Economics, Environment, 
+History, Society, Sports, Entertainment, Education, Geography, Food, Law, Religion
+
+Perspective preferences: diverse, mainstream, critical, expert, personal
+
+Depth levels: surface, medium, deep
+
+Respond in JSON:
+{
+  "core_query": "main search topic",
+  "domains": ["domain1", "domain2"],
+  "time_range": {"from": "YYYY-MM-DD", "to": "YYYY-MM-DD"} or null,
+  "perspective_preferences": ["perspective1"],
+  "depth_level": "surface|medium|deep",
+  "sort_by": "relevance|recency|originality|diverse",
+  "min_content_quality": 0-100,
+  "include_ai_generated": true/false,
+  "intent_explanation": "brief explanation of user intent"
+}"""
+
+# LLM-parsed intents kept for repeat queries; entries expire after the TTL
+# so relative time ranges ("this week") do not go stale
+INTENT_CACHE_SIZE = 1024
+INTENT_CACHE_TTL_SECONDS = 3600
+
+# Result sets smaller than this sort faster with list.sort than via NumPy
+NUMPY_SORT_MIN_RESULTS = 512
+
+# Categories of (category, value) keyword hits
+KW_PERSPECTIVE, KW_DEPTH, KW_SORT, KW_QUALITY, KW_DOMAIN, KW_TIME = range(6)
+
+
+def _build_keyword_hits_table() -> Dict[str, tuple]:
+    """Map every intent keyword to the (category, value) pairs it signals"""
+    
+    table: Dict[str, list] = {}
+    for category, groups in (
+        (KW_PERSPECTIVE, PERSPECTIVE_KEYWORDS),
+        (KW_DEPTH, DEPTH_KEYWORDS),
+        (KW_SORT, SORT_KEYWORDS),
+        (KW_DOMAIN, DOMAIN_KEYWORDS),
+        (KW_TIME, TIME_RANGE_KEYWORDS),
+    ):
+        for value, keywords in groups.items():
+            for keyword in keywords:
+                table.setdefault(keyword, []).append((category, value))
+    for keyword in QUALITY_KEYWORDS:
+        table.setdefault(keyword, []).append((KW_QUALITY, True))
+    return {keyword: tuple(hits) for keyword, hits in table.items()}
+
+
+_KEYWORD_HITS = _build_keyword_hits_table()
+
+
+def _build_keyword_automaton():
+    """One Aho-Corasick automaton over every intent keyword"""
+    
+    automaton = ahocorasick.Automaton()
+    for keyword, hits in _KEYWORD_HITS.items():
+        automaton.add_word(keyword, hits)
+    automaton.make_automaton()
+    return automaton
+
+
+_KEYWORD_AUTOMATON = _build_keyword_automaton() if ahocorasick is not None else None
+
+
+def _match_keywords(query_lower: str) -> set:
+    """
+    Set of (category, value) pairs whose keywords occur in the query.
+    
+    Uses a single automaton pass when pyahocorasick is installed, and a
+    substring check per keyword otherwise.
+    """
+    
+    hits = set()
+    if _KEYWORD_AUTOMATON is None:
+        for keyword, keyword_hits in _KEYWORD_HITS.items():
+            if keyword in query_lower:
+                hits.update(keyword_hits)
+        return hits
+    
+    for _, keyword_hits in _KEYWORD_AUTOMATON.iter(query_lower):
+        hits.update(keyword_hits)
+    return hits
+
+
+@functools.lru_cache(maxsize=65536)
+def _iso_to_epoch(value: str) -> Optional[float]:
+    """
+    POSIX timestamp for an ISO string, memoized since claim times never
+    change. Naive values are taken as UTC; unparseable values give None.
+    """
+    try:
+        parsed = datetime.fromisoformat(value.replace('Z', '+00:00'))
+    except ValueError:
+        return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed.timestamp()
+
+
+def _is_date_only(value: str) -> bool:
+    """Whether an ISO string is a bare calendar date, with no time part"""
+    try:
+        date.fromisoformat(value)
+    except ValueError:
+        return False
+    return True
+
+
+def _claim_timestamp(claim: Dict[str, Any]) -> Optional[float]:
+    """POSIX timestamp of a claim's created_at, or None if missing/invalid"""
+    created_at = claim.get('created_at')
+    if not created_at or not isinstance(created_at, str):
+        return None
+    return _iso_to_epoch(created_at)
+
+
+def _recency_key(claim: Dict[str, Any]) -> float:
+    """Sort key for newest-first ordering"""
+    ts = _claim_timestamp(claim)
+    return ts if ts is not None else float('-inf')
+
+
+def _originality_key(claim: Dict[str, Any]):
+    return claim.get('originality_score', 0)
+
+
+def _diversity_key(claim: Dict[str, Any]):
+    return (
+        claim.get('perspective_diversity_score', 0),
+        claim.get('annotation_diversity_score', 0)
+    )
+
+
+def _relevance_key(claim: Dict[str, Any]):
+    return claim.get('relevance_score', 0)
+
+
+def _sort_key(sort_by: str):
+    """
+    Highest-first key for a sort criterion. Recency is chronological rather
+    than lexicographic, so mixed UTC offsets order correctly and undated
+    claims sort last; unknown criteria sort by relevance.
+    """
+    if sort_by == "recency":
+        return _recency_key
+    if sort_by == "originality":
+        return _originality_key
+    if sort_by == "diverse":
+        return _diversity_key
+    return _relevance_key
+
 
-@dataclass
+def _score_column(claims: List[Dict[str, Any]], field: str) -> np.ndarray:
+    """One numeric field of every claim as a float64 array (missing -> 0)"""
+    column = np.fromiter((c.get(field, 0) for c in claims), dtype=np.float64, count=len(claims))
+    if np.isnan(column).any():
+        # fromiter reads None as NaN; leave such data to list.sort
+        raise ValueError(f"non-numeric {field}")
+    return column
+
+
+def _descending_order(claims: List[Dict[str, Any]], sort_by: str) -> np.ndarray:
+    """
+    Stable highest-first permutation of claims, matching
+    list.sort(key=..., reverse=True) in _sort_results.
+    """
+    if sort_by == "diverse":
+        # lexsort sorts by the last key first
+        return np.lexsort((
+            -_score_column(claims, 'annotation_diversity_score'),
+            -_score_column(claims, 'perspective_diversity_score'),
+        ))
+    
+    if sort_by == "originality":
+        keys = _score_column(claims, 'originality_score')
+    else:
+        keys = _score_column(claims, 'relevance_score')
+    return np.argsort(-keys, kind='stable')
+
+
+@dataclass(slots=True, frozen=True)
 class SearchIntent:
     """Parsed user search intent"""
     core_query: str
@@ -48,9 +291,29 @@ class NaturalLanguageSearchEngine:
     - "In-depth analysis of quantum computing"
     """
     
+    # Shared by all engines: the server creates one per request. Values are
+    # (expiry monotonic time, intent); intents are frozen so sharing is safe.
+    _intent_cache: "OrderedDict[str, Tuple[float, SearchIntent]]" = OrderedDict()
+    
     def __init__(self, api_key: Optional[str] = None):
         self.api_key = api_key or os.environ.get('EMERGENT_LLM_KEY')
     
+    def _get_intent_chat(self):
+        """
+        Return an intent-parsing LLM chat for a single query.
+        
+        LlmChat keeps conversation history per session, so each query gets
+        its own session rather than sharing one across users.
+        """
+        
+        from emergentintegrations.llm.chat import LlmChat
+        
+        return LlmChat(
+            api_key=self.api_key,
+            session_id=f"search-{uuid.uuid4().hex}",
+            system_message=SEARCH_INTENT_SYSTEM_MSG
+        ).with_model("openai", "gpt-4o-mini")
+    
     async def parse_search_intent(self, query: str) -> SearchIntent:
         """
         Parse natural language query into structured search intent.
@@ -61,41 +324,22 @@ class NaturalLanguageSearchEngine:
         if not self.api_key:
             return self._parse_search_intent_fallback(query)
         
+        cached = self._intent_cache.get(query)
+        if cached is not None:
+            if cached[0] > time.monotonic():
+                self._intent_cache.move_to_end(query)
+                return cached[1]
+            del self._intent_cache[query]
+        
         try:
-            from emergentintegrations.llm.chat import LlmChat, UserMessage
-            
-            chat = LlmChat(
-                api_key=self.api_key,
-                session_id=f"search-{datetime.now().timestamp()}",
-                system_message="""You are a search intent analyzer for Thrryv.
-Convert natural language search queries into structured intent.
-
-Available domains: Science, Health, Technology, Politics, Economics, Environment, 
-History, Society, Sports, Entertainment, Education, Geography, Food, Law, Religion
-
-Perspective preferences: diverse, mainstream, critical, expert, personal
-
-Depth levels: surface, medium, deep
-
-Respond in JSON:
-{
-  "core_query": "main search topic",
-  "domains": ["domain1", "domain2"],
-  "time_range": {"from": "YYYY-MM-DD", "to": "YYYY-MM-DD"} or null,
-  "perspective_preferences": ["perspective1"],
-  "depth_level": "surface|medium|deep",
-  "sort_by": "relevance|recency|originality|diverse",
-  "min_content_quality": 0-100,
-  "include_ai_generated": true/false,
-  "intent_explanation": "brief explanation of user intent"
-}"""
-            ).with_model("openai", "gpt-4o-mini")
+            from emergentintegrations.llm.chat import UserMessage
             
+            chat = self._get_intent_chat()
             response = await chat.send_message(UserMessage(text=f"Parse search intent: {query}"))
             result = self._parse_json_response(response)
             
             if result:
-                return SearchIntent(
+                intent = SearchIntent(
                     core_query=result.get('core_query', query),
                     domains=result.get('domains', []),
                     time_range=result.get('time_range'),
@@ -106,6 +350,10 @@ Respond in JSON:
                     include_ai_generated=result.get('include_ai_generated', False),
                     structured_filters=result.get('filters', {})
                 )
+                self._intent_cache[query] = (time.monotonic() + INTENT_CACHE_TTL_SECONDS, intent)
+                if len(self._intent_cache) > INTENT_CACHE_SIZE:
+                    self._intent_cache.popitem(last=False)
+                return intent
         
         except Exception as e:
             logger.warning(f"LLM search parsing failed: {e}")
@@ -115,49 +363,57 @@ Respond in JSON:
     def _parse_search_intent_fallback(self, query: str) -> SearchIntent:
         """
         Fallback search intent parsing using pattern matching.
+        
+        Memoized per query and UTC calendar day (time ranges are relative
+        to today).
         """
         
+        return self._fallback_intent(query, datetime.now(timezone.utc).date())
+    
+    @staticmethod
+    @functools.lru_cache(maxsize=INTENT_CACHE_SIZE)
+    def _fallback_intent(query: str, day) -> SearchIntent:
+        """Pattern-matching intent for `query` as of `day`"""
+        
         query_lower = query.lower()
         
+        # One keyword scan drives every preference below
+        hits = _match_keywords(query_lower)
+        
         # Extract time preferences
-        time_range = self._extract_time_range(query)
+        time_range = NaturalLanguageSearchEngine._extract_time_range(query, hits, day)
         
         # Extract perspective preferences
-        perspective_prefs = []
-        if any(word in query_lower for word in ["different", "diverse", "other", "perspectives", "viewpoints"]):
-            perspective_prefs.append("diverse")
-        if any(word in query_lower for word in ["mainstream", "popular", "consensus", "most people"]):
-            perspective_prefs.append("mainstream")
-        if any(word in query_lower for word in ["critical", "against", "opposition", "disagree"]):
-            perspective_prefs.append("critical")
-        if any(word in query_lower for word in ["expert", "research", "study", "scientific"]):
-            perspective_prefs.append("expert")
+        perspective_prefs = [
+            value for value in PERSPECTIVE_KEYWORDS
+            if (KW_PERSPECTIVE, value) in hits
+        ]
         
         if not perspective_prefs:
             perspective_prefs.append("diverse")
         
         # Extract depth preference
         depth = "medium"
-        if any(word in query_lower for word in ["briefly", "overview", "quick", "summary"]):
+        if (KW_DEPTH, "surface") in hits:
             depth = "surface"
-        elif any(word in query_lower for word in ["deep", "detail", "comprehensive", "thorough", "explain in depth"]):
+        elif (KW_DEPTH, "deep") in hits:
             depth = "deep"
         
         # Extract sort preference
         sort_by = "relevance"
-        if any(word in query_lower for word in ["recent", "latest", "new"]):
+        if (KW_SORT, "recency") in hits:
             sort_by = "recency"
-        elif any(word in query_lower for word in ["original", "novel", "unique"]):
+        elif (KW_SORT, "originality") in hits:
             sort_by = "originality"
         elif "diverse" in perspective_prefs:
             sort_by = "diverse"
         
         # Extract domain keywords
-        domains = self._extract_domains(query)
+        domains = NaturalLanguageSearchEngine._extract_domains(query, hits)
         
         # Minimum quality
         min_quality = 30
-        if any(word in query_lower for word in ["quality", "well-researched", "credible", "authoritative"]):
+        if (KW_QUALITY, True) in hits:
             min_quality = 60
         
         return SearchIntent(
@@ -172,77 +428,52 @@ Respond in JSON:
             structured_filters={}
         )
     
-    def _extract_time_range(self, query: str) -> Optional[Dict[str, str]]:
-        """Extract time range from query"""
-        
-        query_lower = query.lower()
-        today = datetime.now()
-        
-        # Recent time periods
-        if any(word in query_lower for word in ["today", "yesterday"]):
-            start = (today - timedelta(days=1)).strftime("%Y-%m-%d")
-            end = today.strftime("%Y-%m-%d")
-            return {"from": start, "to": end}
-        
-        if any(word in query_lower for word in ["this week", "last week", "past week"]):
-            start = (today - timedelta(days=7)).strftime("%Y-%m-%d")
-            end = today.strftime("%Y-%m-%d")
-            return {"from": start, "to": end}
-        
-        if any(word in query_lower for word in ["this month", "last month", "past month"]):
-            start = (today - timedelta(days=30)).strftime("%Y-%m-%d")
-            end = today.strftime("%Y-%m-%d")
-            return {"from": start, "to": end}
-        
-        if any(word in query_lower for word in ["this year", "past year", "last year"]):
-            start = (today - timedelta(days=365)).strftime("%Y-%m-%d")
-            end = today.strftime("%Y-%m-%d")
-            return {"from": start, "to": end}
-        
-        if any(word in query_lower for word in ["historical", "all time", "anytime"]):
-            return None  # No time constraint
+    @staticmethod
+    def _extract_time_range(
+        query: str,
+        hits: Optional[set] = None,
+        today: Optional[date] = None
+    ) -> Optional[Dict[str, str]]:
+        """Extract time range from query, as UTC dates ending today"""
+        
+        if hits is None:
+            hits = _match_keywords(query.lower())
+        
+        for span, days in TIME_RANGE_DAYS.items():
+            if (KW_TIME, span) in hits:
+                if days is None:
+                    return None  # No time constraint
+                if today is None:
+                    today = datetime.now(timezone.utc).date()
+                start = (today - timedelta(days=days)).strftime("%Y-%m-%d")
+                end = today.strftime("%Y-%m-%d")
+                return {"from": start, "to": end}
         
         return None
     
-    def _extract_domains(self, query: str) -> List[str]:
+    @staticmethod
+    def _extract_domains(query: str, hits: Optional[set] = None) -> List[str]:
         """Extract domain keywords from query"""
         
-        query_lower = query.lower()
+        if hits is None:
+            hits = _match_keywords(query.lower())
         
-        domain_keywords = {
-            "Science": ["science", "research", "study", "experiment", "scientific", "physics", "biology", "chemistry"],
-            "Health": ["health", "medical", "disease", "vaccine", "wellness", "doctor", "hospital"],
-            "Technology": ["technology", "tech", "AI", "computer", "software", "digital", "innovation"],
-            "Politics": ["political", "government", "election", "policy", "vote", "president", "congress"],
-            "Economics": ["economy", "economic", "financial", "market", "business", "trade", "wealth"],
-            "Environment": ["environment", "climate", "pollution", "renewable", "sustainability"],
-            "History": ["history", "historical", "ancient", "past", "century", "war", "empire"],
-            "Society": ["social", "society", "culture", "community", "demographic", "equality"],
-            "Sports": ["sport", "athletic", "game", "competition", "player", "team", "championship"],
-            "Entertainment": ["movie", "music", "celebrity", "actor", "entertainment", "film"],
-        }
-        
-        domains = []
-        for domain, keywords in domain_keywords.items():
-            if any(kw in query_lower for kw in keywords):
-                domains.append(domain)
-        
-        return domains
+        return [domain for domain in DOMAIN_KEYWORDS if (KW_DOMAIN, domain) in hits]
     
     @staticmethod
     def _parse_json_response(response: str) -> Optional[Dict[str, Any]]:
         """Parse JSON from LLM response"""
         
         try:
-            return json.loads(response)
+            return _loads(response)
         except json.JSONDecodeError:
             # Try to extract JSON
             start = response.find('{')
             end = response.rfind('}') + 1
             if start >= 0 and end > start:
                 try:
-                    return json.loads(response[start:end])
-                except:
+                    return _loads(response[start:end])
+                except ValueError:
                     pass
         
         return None
@@ -250,70 +481,86 @@ Respond in JSON:
     async def execute_search(
         self,
         intent: SearchIntent,
-        available_claims: List[Dict[str, Any]]
+        available_claims: List[Dict[str, Any]],
+        top_k: Optional[int] = None
     ) -> List[Dict[str, Any]]:
         """
         Execute search based on parsed intent.
         
-        Filters and sorts claims according to user's intent.
+        Filters and sorts claims according to user's intent. With top_k,
+        only the best top_k results are kept (same order as a full sort).
         """
         
-        results = available_claims
-        
-        # Filter by domain
-        if intent.domains:
-            results = [
-                c for c in results
-                if c.get('domain') in intent.domains
-            ]
-        
-        # Filter by time range
-        if intent.time_range:
-            results = self._filter_by_time_range(results, intent.time_range)
-        
-        # Filter by content quality
-        if intent.min_content_quality > 0:
-            results = [
-                c for c in results
-                if c.get('quality_score', 0) >= intent.min_content_quality
-            ]
-        
-        # Filter AI-generated
-        if not intent.include_ai_generated:
-            results = [
-                c for c in results
-                if not c.get('is_ai_generated', False)
-            ]
+        domains = set(intent.domains) if intent.domains else None
+        bounds = self._time_bounds(intent.time_range) if intent.time_range else None
+        min_quality = intent.min_content_quality
+        exclude_ai = not intent.include_ai_generated
+        
+        # Domain, time range, quality and AI-generated filters in one pass,
+        # so each claim is visited once and only survivors are materialized
+        matches = (
+            c for c in available_claims
+            if (domains is None or c.get('domain') in domains)
+            and (bounds is None or (
+                (ts := _claim_timestamp(c)) is not None and bounds[0] <= ts < bounds[1]
+            ))
+            and (min_quality <= 0 or c.get('quality_score', 0) >= min_quality)
+            and not (exclude_ai and c.get('is_ai_generated', False))
+        )
+        
+        if top_k is not None:
+            # Keep a k-element heap instead of sorting every match
+            return heapq.nlargest(top_k, matches, key=_sort_key(intent.sort_by))
         
         # Sort results
-        results = self._sort_results(results, intent.sort_by)
+        results = self._sort_results(list(matches), intent.sort_by)
         
         return results
     
     @staticmethod
+    def _time_bounds(time_range: Dict[str, str]) -> Optional[Tuple[float, float]]:
+        """
+        Half-open [from, to) POSIX timestamps of a time range, or None if
+        invalid. Both ends are read as UTC when they carry no offset; a
+        date-only "to" covers that whole day, so the bound is the start of
+        the next one.
+        """
+        
+        try:
+            from_ts = _iso_to_epoch(time_range['from'])
+            to_value = time_range['to']
+            to_ts = _iso_to_epoch(to_value)
+        except Exception:
+            from_ts = to_ts = None
+        
+        if from_ts is None or to_ts is None:
+            logger.warning(f"Error filtering by time range: invalid range {time_range}")
+            return None
+        
+        if _is_date_only(to_value):
+            return from_ts, to_ts + 86400.0
+        # A full timestamp is an inclusive end
+        return from_ts, math.nextafter(to_ts, math.inf)
+    
+    @classmethod
     def _filter_by_time_range(
+        cls,
         claims: List[Dict[str, Any]],
         time_range: Dict[str, str]
     ) -> List[Dict[str, Any]]:
         """Filter claims by time range"""
         
-        try:
-            from_date = datetime.fromisoformat(time_range['from'])
-            to_date = datetime.fromisoformat(time_range['to'])
-            
-            filtered = []
-            for claim in claims:
-                created_at_str = claim.get('created_at', '')
-                if created_at_str:
-                    created_at = datetime.fromisoformat(created_at_str.replace('Z', '+00:00'))
-                    if from_date <= created_at <= to_date:
-                        filtered.append(claim)
-            
-            return filtered
-        
-        except Exception as e:
-            logger.warning(f"Error filtering by time range: {e}")
+        bounds = cls._time_bounds(time_range)
+        if bounds is None:
             return claims
+        
+        # Epoch comparisons on memoized timestamps; claims without a valid
+        # created_at fall outside every range
+        from_ts, to_ts = bounds
+        return [
+            claim for claim in claims
+            if (ts := _claim_timestamp(claim)) is not None and from_ts <= ts < to_ts
+        ]
     
     @staticmethod
     def _sort_results(
@@ -322,32 +569,19 @@ Respond in JSON:
     ) -> List[Dict[str, Any]]:
         """Sort claims by specified criteria"""
         
-        if sort_by == "recency":
-            claims.sort(
-                key=lambda x: x.get('created_at', ''),
-                reverse=True
-            )
-        
-        elif sort_by == "originality":
-            claims.sort(
-                key=lambda x: x.get('originality_score', 0),
-                reverse=True
-            )
-        
-        elif sort_by == "diverse":
-            # Sort by diversity indicators
-            claims.sort(
-                key=lambda x: (
-                    x.get('perspective_diversity_score', 0),
-                    x.get('annotation_diversity_score', 0)
-                ),
-                reverse=True
-            )
-        
-        else:  # relevance (default)
-            claims.sort(
-                key=lambda x: x.get('relevance_score', 0),
-                reverse=True
-            )
+        # Recency keys need a per-claim Python call either way, so only the
+        # plain numeric sorts gain from NumPy
+        if len(claims) >= NUMPY_SORT_MIN_RESULTS and sort_by != "recency":
+            # Extract each key column once and sort in C; non-numeric keys
+            # fall through to list.sort, which handles (or rejects) them as before
+            try:
+                order = _descending_order(claims, sort_by)
+            except (TypeError, ValueError):
+                order = None
+            if order is not None:
+                claims[:] = [claims[i] for i in order.tolist()]
+                return claims
+        
+        claims.sort(key=_sort_key(sort_by), reverse=True)
         
         return claims
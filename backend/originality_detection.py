@@ -13,19 +13,122 @@ Key features:
 """
 
 import os
+import asyncio
 import logging
+import uuid
 from typing import Dict, Any, List, Optional, Tuple
 from dataclasses import dataclass
 from datetime import datetime
 import hashlib
+import json
+import string
+import numpy as np
 from dotenv import load_dotenv
 
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads
+
+try:
+    from blake3 import blake3
+    
+    def _fingerprint(text: str) -> bytes:
+        """16-byte content fingerprint for exact-duplicate detection"""
+        return blake3(text.encode('utf-8', 'surrogatepass')).digest(16)
+except ImportError:
+    def _fingerprint(text: str) -> bytes:
+        """16-byte content fingerprint for exact-duplicate detection"""
+        return hashlib.blake2b(text.encode('utf-8', 'surrogatepass'), digest_size=16).digest()
+
+from _sim_kernel import token_overlap, token_overlap_batch
+
 load_dotenv()
 
 logger = logging.getLogger(__name__)
 
+# Concurrent LLM similarity requests per detector (provider rate limits)
+MAX_CONCURRENT_SIMILARITY = 16
+
+SIMILARITY_SYSTEM_MSG = """You are a semantic similarity analyzer.
+Compare two text snippets and determine how similar they are semantically (0-1 scale).
+Consider:
+- Same topic/subject
+- Same perspective or viewpoint
+- Similar claims or arguments
+- Paraphrasing vs original
+
+Respond ONLY with JSON:
+{"similarity": <0.0-1.0>, "reasoning": "brief explanation"}"""
+
+# Words ignored by the keyword-overlap (fallback semantic) similarity
+COMMON_WORDS = frozenset({
+    'the', 'a', 'an', 'and', 'or', 'but', 'is', 'are', 'was', 'were',
+    'be', 'been', 'being', 'that', 'this', 'it', 'to', 'for', 'of', 'in',
+    'on', 'at', 'by', 'with', 'from', 'as', 'about', 'into', 'through',
+    'during', 'can', 'could', 'would', 'should', 'may', 'might', 'must'
+})
+
+# Translation table deleting ASCII punctuation, built once for _tokenize
+_PUNCTUATION_TABLE = str.maketrans('', '', string.punctuation)
+
+# New claims scored per corpus pass in bulk runs (bounds the
+# (batch, corpus) result arrays)
+SIMILARITY_BATCH_SIZE = 64
+
+# MinHash signature width; estimate error is about 1/sqrt(MINHASH_PERMUTATIONS)
+MINHASH_PERMUTATIONS = 128
+_MINHASH_EMPTY = np.iinfo(np.uint64).max
+
+# Banded LSH over the signatures: a claim is a candidate when all rows of
+# any band agree. 32 bands of 4 rows put the recall knee near Jaccard 0.4
+# (~99% recall at 0.6, ~50% at 0.4), so near-copies are always found but
+# borderline matches can be missed. Only used for corpora this large;
+# below it the exact scan is cheap enough to keep results exact.
+LSH_BANDS = 32
+LSH_MIN_CORPUS = 20000
+# Above this share of the corpus as candidates, the exact scan is cheaper
+LSH_MAX_CANDIDATE_FRACTION = 0.125
+_LSH_ROWS = MINHASH_PERMUTATIONS // LSH_BANDS
+_LSH_MIX = np.uint64(0x9E3779B97F4A7C15)
+
+# Fixed (a, b) pairs for the hash family h(x) = a*x + b mod 2**64. Seeded so
+# signatures are comparable across processes and restarts.
+_minhash_rng = np.random.default_rng(0x546872727976)
+_MINHASH_A = _minhash_rng.integers(
+    0, 2**64, size=MINHASH_PERMUTATIONS, dtype=np.uint64
+) | np.uint64(1)
+_MINHASH_B = _minhash_rng.integers(0, 2**64, size=MINHASH_PERMUTATIONS, dtype=np.uint64)
+del _minhash_rng
+
+
+def _token_hash(token: str) -> int:
+    """Stable 64-bit token hash (builtin hash() is salted per process)"""
+    return int.from_bytes(hashlib.blake2b(token.encode(), digest_size=8).digest(), 'little')
+
+
+def _minhash(tokens) -> np.ndarray:
+    """MinHash signature of a token set, one uint64 per permutation"""
+    
+    if not tokens:
+        return np.full(MINHASH_PERMUTATIONS, _MINHASH_EMPTY, dtype=np.uint64)
+    
+    hashes = np.fromiter((_token_hash(t) for t in tokens), dtype=np.uint64, count=len(tokens))
+    return (hashes[:, None] * _MINHASH_A + _MINHASH_B).min(axis=0)
+
+
+def _band_keys(signatures: np.ndarray) -> np.ndarray:
+    """Collapse each LSH band of one or more signatures into a uint64 key"""
+    
+    bands = signatures.reshape(signatures.shape[:-1] + (LSH_BANDS, _LSH_ROWS))
+    keys = bands[..., 0].copy()
+    for row in range(1, _LSH_ROWS):
+        keys = keys * _LSH_MIX + bands[..., row]
+    return keys
+
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class OriginalityAnalysis:
     """Analysis of content originality"""
     claim_id: str
@@ -37,6 +140,192 @@ class OriginalityAnalysis:
     analysis_timestamp: str
 
 
+class _CorpusIndex:
+    """
+    Token index over existing claims for vectorized similarity.
+    
+    Each claim's distinct tokens are mapped to integer ids and stored flat
+    (one entry per claim/token pair, tagged with the claim's position), so
+    the overlap between a new claim and every existing claim is a few NumPy
+    passes instead of a Python set operation per pair. Scores are exact:
+    the same Jaccard and keyword-overlap ratios the pairwise code computes.
+    """
+    
+    def __init__(self, claims: List[Dict[str, Any]], tokenize):
+        self.claims = claims
+        self.texts = [claim.get('text', '') for claim in claims]
+        # Each claim is tokenized exactly once; pairwise paths reuse these
+        self.token_sets = [frozenset(tokenize(text)) for text in self.texts]
+        # Positions of claims by text fingerprint, for exact duplicates
+        self.fingerprints: Dict[bytes, List[int]] = {}
+        for position, text in enumerate(self.texts):
+            self.fingerprints.setdefault(_fingerprint(text), []).append(position)
+        self.vocab: Dict[str, int] = {}
+        
+        token_ids: List[int] = []
+        doc_of: List[int] = []
+        token_counts: List[int] = []
+        keyword_counts: List[int] = []
+        
+        for position, tokens in enumerate(self.token_sets):
+            token_counts.append(len(tokens))
+            keyword_counts.append(len(tokens - COMMON_WORDS))
+            for token in tokens:
+                token_ids.append(self.vocab.setdefault(token, len(self.vocab)))
+            doc_of.extend([position] * len(tokens))
+        
+        is_keyword = np.fromiter(
+            (token not in COMMON_WORDS for token in self.vocab),
+            dtype=np.bool_, count=len(self.vocab)
+        )
+        self.vocab_is_keyword = is_keyword
+        self.token_ids = np.asarray(token_ids, dtype=np.intp)
+        self.doc_of = np.asarray(doc_of, dtype=np.intp)
+        self.entry_is_keyword = is_keyword[self.token_ids]
+        self.token_counts = np.asarray(token_counts, dtype=np.float64)
+        self.keyword_counts = np.asarray(keyword_counts, dtype=np.float64)
+        # Claim i owns entries offsets[i]:offsets[i + 1]
+        self.offsets = np.zeros(len(claims) + 1, dtype=np.intp)
+        np.cumsum(token_counts, out=self.offsets[1:])
+        self._signatures: Optional[np.ndarray] = None
+        self._lsh: Optional[Tuple[np.ndarray, np.ndarray]] = None
+        self._postings: Optional[Tuple[np.ndarray, np.ndarray]] = None
+    
+    def __len__(self) -> int:
+        return len(self.claims)
+    
+    @property
+    def signatures(self) -> np.ndarray:
+        """
+        (claims, MINHASH_PERMUTATIONS) MinHash signatures, built on first use.
+        
+        Each vocabulary token is hashed once; a claim's signature is then the
+        per-permutation minimum over its (contiguous) entries.
+        """
+        
+        if self._signatures is None:
+            n = len(self.claims)
+            signatures = np.full((n, MINHASH_PERMUTATIONS), _MINHASH_EMPTY, dtype=np.uint64)
+            if len(self.token_ids):
+                vocab_hash = np.fromiter(
+                    (_token_hash(t) for t in self.vocab), dtype=np.uint64, count=len(self.vocab)
+                )
+                entry_hash = vocab_hash[self.token_ids]
+                nonempty = self.token_counts > 0
+                starts = self.offsets[:-1][nonempty]
+                for p in range(MINHASH_PERMUTATIONS):
+                    signatures[nonempty, p] = np.minimum.reduceat(
+                        entry_hash * _MINHASH_A[p] + _MINHASH_B[p], starts
+                    )
+            self._signatures = signatures
+        return self._signatures
+    
+    def build_lsh(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Per-band sorted LSH keys and their claim positions, built once"""
+        
+        if self._lsh is None:
+            keys = _band_keys(self.signatures)
+            order = np.argsort(keys, axis=0, kind='stable')
+            self._lsh = (np.take_along_axis(keys, order, axis=0), order)
+        return self._lsh
+    
+    def lsh_candidates(self, signature: np.ndarray) -> np.ndarray:
+        """
+        Positions of claims sharing at least one LSH band with `signature`.
+        
+        Band keys are sorted per band once, so a lookup is LSH_BANDS binary
+        searches rather than a scan of the corpus.
+        """
+        
+        sorted_keys, order = self.build_lsh()
+        
+        query_keys = _band_keys(signature)
+        hits = []
+        for band in range(LSH_BANDS):
+            column = sorted_keys[:, band]
+            lo = np.searchsorted(column, query_keys[band], side='left')
+            hi = np.searchsorted(column, query_keys[band], side='right')
+            if hi > lo:
+                hits.append(order[lo:hi, band])
+        if not hits:
+            return np.zeros(0, dtype=np.intp)
+        candidates = np.unique(np.concatenate(hits))
+        # Empty claims share the all-max signature but can never match
+        return candidates[self.token_counts[candidates] > 0]
+    
+    def similarities_at(self, tokens: frozenset, positions: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """similarities() restricted to the claims at `positions`"""
+        
+        n_tokens = len(tokens)
+        keywords = tokens - COMMON_WORDS
+        n_keywords = len(keywords)
+        jaccard = np.zeros(len(positions))
+        overlap = np.zeros(len(positions))
+        for j, i in enumerate(positions.tolist()):
+            other = self.token_sets[i]
+            if not other:
+                continue
+            shared = len(tokens & other)
+            jaccard[j] = shared / (n_tokens + len(other) - shared)
+            keyword_count = self.keyword_counts[i]
+            if n_keywords and keyword_count:
+                overlap[j] = len(keywords & other) / max(keyword_count, n_keywords)
+        return jaccard, overlap
+    
+    def similarities(self, tokens: set) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Token Jaccard and keyword overlap of `tokens` against every claim.
+        
+        Keyword overlap is shared keywords over the larger keyword set, as in
+        _calculate_semantic_similarity_fallback. Both are 0 where either side
+        has nothing to compare.
+        """
+        
+        query_ids = [self.vocab[t] for t in tokens if t in self.vocab]
+        in_query = np.zeros(len(self.vocab), dtype=np.bool_)
+        in_query[query_ids] = True
+        
+        return token_overlap(
+            in_query, self.token_ids, self.doc_of, self.entry_is_keyword,
+            self.token_counts, self.keyword_counts, len(tokens), len(tokens - COMMON_WORDS)
+        )
+    
+    @property
+    def postings(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Inverted index, built on first use: claims containing vocabulary id v
+        are docs[offsets[v]:offsets[v + 1]].
+        """
+        
+        if self._postings is None:
+            order = np.argsort(self.token_ids, kind='stable')
+            offsets = np.zeros(len(self.vocab) + 1, dtype=np.intp)
+            np.cumsum(np.bincount(self.token_ids, minlength=len(self.vocab)), out=offsets[1:])
+            self._postings = (offsets, self.doc_of[order])
+        return self._postings
+    
+    def similarities_batch(self, token_sets: List[frozenset]) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        similarities() for several token sets at once, from the postings of
+        their tokens rather than a scan of the corpus per set.
+        
+        Returns (len(token_sets), claims) arrays; row k equals
+        similarities(token_sets[k]).
+        """
+        
+        in_query = np.zeros((len(self.vocab), len(token_sets)), dtype=np.bool_)
+        for k, tokens in enumerate(token_sets):
+            in_query[[self.vocab[t] for t in tokens if t in self.vocab], k] = True
+        
+        postings_offsets, postings_docs = self.postings
+        return token_overlap_batch(
+            in_query, postings_offsets, postings_docs, self.vocab_is_keyword,
+            self.token_counts, self.keyword_counts,
+            [len(tokens) for tokens in token_sets],
+            [len(tokens - COMMON_WORDS) for tokens in token_sets]
+        )
+
+
 class OriginalityDetector:
     """
     Detects and analyzes originality of content.
@@ -48,10 +337,20 @@ class OriginalityDetector:
     - Detects plagiarism/duplication
     """
     
-    def __init__(self, api_key: Optional[str] = None):
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        max_concurrency: int = MAX_CONCURRENT_SIMILARITY
+    ):
         self.api_key = api_key or os.environ.get('EMERGENT_LLM_KEY')
         self.similarity_threshold = 0.75  # 75% similarity = likely duplicate
         self.moderate_similarity = 0.55  # 55% similarity = moderate match
+        # Pairs below this token Jaccard skip the LLM and are scored with
+        # keyword overlap instead (tunable: lower means more LLM calls)
+        self.prune_threshold = 0.3
+        self._llm_semaphore = asyncio.Semaphore(max_concurrency)
+        self._corpus_index: Optional[_CorpusIndex] = None
+        self._corpus_key: Optional[Tuple[str, ...]] = None
     
     async def analyze_originality(
         self,
@@ -69,13 +368,28 @@ class OriginalityDetector:
             Detailed originality analysis
         """
         
+        return await self._analyze_against_index(claim, self._get_corpus_index(existing_claims))
+    
+    async def _analyze_against_index(
+        self,
+        claim: Dict[str, Any],
+        index: _CorpusIndex,
+        overlaps: Optional[Tuple[np.ndarray, np.ndarray]] = None
+    ) -> OriginalityAnalysis:
+        """
+        analyze_originality against an already-built corpus index, optionally
+        with the claim's (token similarity, keyword overlap) precomputed
+        """
+        
         claim_text = claim.get('text', '')
         claim_id = claim.get('id', '')
         
         # Get similarity matches
         similarity_matches = await self._find_similar_content(
             claim_text,
-            existing_claims
+            index.claims,
+            index,
+            overlaps
         )
         
         # Calculate originality score
@@ -112,72 +426,153 @@ class OriginalityDetector:
     async def _find_similar_content(
         self,
         claim_text: str,
-        existing_claims: List[Dict[str, Any]]
+        existing_claims: List[Dict[str, Any]],
+        index: Optional[_CorpusIndex] = None,
+        overlaps: Optional[Tuple[np.ndarray, np.ndarray]] = None
     ) -> List[Dict[str, Any]]:
         """
         Find similar content in existing claims.
         
-        Uses both semantic and textual similarity.
+        Uses both semantic and textual similarity. Pass `index` to reuse a
+        corpus index (and its token sets) already built for existing_claims,
+        and `overlaps` to reuse this claim's similarities() against it.
         """
         
-        similar_matches = []
+        tokens = frozenset(self._tokenize(claim_text))
+        if not tokens:
+            return []
+        
+        # Token overlap for every existing claim in one vectorized pass
+        if index is None:
+            index = self._get_corpus_index(existing_claims)
+        # Verbatim copies are duplicates outright; they need no LLM call
+        exact = index.fingerprints.get(_fingerprint(claim_text), [])
+        
+        positions = None
+        if len(index) >= LSH_MIN_CORPUS:
+            # Large corpus: only claims sharing an LSH bucket (or verbatim
+            # copies) are compared at all
+            positions = np.union1d(
+                index.lsh_candidates(_minhash(tokens)), np.asarray(exact, dtype=np.intp)
+            )
+            if len(positions) > len(index) * LSH_MAX_CANDIDATE_FRACTION:
+                positions = None
+        
+        if positions is not None:
+            token_similarity, keyword_overlap = index.similarities_at(tokens, positions)
+        else:
+            positions = np.arange(len(index))
+            if overlaps is None:
+                overlaps = index.similarities(tokens)
+            token_similarity, keyword_overlap = overlaps
+        is_exact = np.isin(positions, exact)
+        
+        semantic_similarity = keyword_overlap
+        if self.api_key:
+            # Ask the LLM only about pairs with meaningful token overlap, all
+            # at once; the rest keep the keyword-overlap estimate
+            is_candidate = (
+                (index.token_counts[positions] > 0) &
+                (token_similarity >= self.prune_threshold) &
+                ~is_exact
+            )
+            candidates = np.flatnonzero(is_candidate).tolist()
+            if candidates:
+                semantic_similarity = keyword_overlap.copy()
+                semantic_similarity[candidates] = await asyncio.gather(*[
+                    self._bounded_semantic_similarity(
+                        claim_text, index.texts[i], tokens, index.token_sets[i]
+                    )
+                    for i in positions[candidates].tolist()
+                ])
         
-        for existing_claim in existing_claims:
-            existing_text = existing_claim.get('text', '')
-            
-            # Calculate similarity
-            similarity = await self._calculate_similarity(claim_text, existing_text)
-            
-            if similarity >= self.moderate_similarity:
-                similar_matches.append({
-                    'claim_id': existing_claim.get('id', ''),
-                    'author_id': existing_claim.get('author_id', ''),
-                    'text_preview': existing_text[:150],
-                    'similarity': similarity,
-                    'created_at': existing_claim.get('created_at', ''),
-                    'annotation_count': existing_claim.get('annotation_count', 0)
-                })
+        # Combine scores (60% semantic, 40% token)
+        similarity = np.clip((semantic_similarity * 0.6) + (token_similarity * 0.4), 0.0, 1.0)
+        similarity[is_exact] = 1.0
+        
+        similar_matches = []
+        for j in np.flatnonzero(similarity >= self.moderate_similarity).tolist():
+            i = int(positions[j])
+            existing_claim = index.claims[i]
+            similar_matches.append({
+                'claim_id': existing_claim.get('id', ''),
+                'author_id': existing_claim.get('author_id', ''),
+                'text_preview': index.texts[i][:150],
+                'similarity': float(similarity[j]),
+                'created_at': existing_claim.get('created_at', ''),
+                'annotation_count': existing_claim.get('annotation_count', 0)
+            })
         
         # Sort by similarity (highest first)
         similar_matches.sort(key=lambda x: x['similarity'], reverse=True)
         
         return similar_matches
     
-    async def _calculate_similarity(
-        self,
-        text1: str,
-        text2: str
-    ) -> float:
+    def index_claims(self, existing_claims: List[Dict[str, Any]]) -> _CorpusIndex:
         """
-        Calculate similarity between two texts.
+        Index existing claims ahead of analysis and return the index.
         
-        Uses multiple methods for robust comparison.
+        Corpora of LSH_MIN_CORPUS claims or more also get their MinHash
+        signatures and LSH buckets built here, so each analysis against them
+        only compares the claims in matching buckets. The index is reused by
+        later calls with the same claims (by id).
         """
         
-        # Method 1: Token overlap (simple but fast)
-        tokens1 = set(self._tokenize(text1))
-        tokens2 = set(self._tokenize(text2))
+        index = self._get_corpus_index(existing_claims)
+        if len(index) >= LSH_MIN_CORPUS:
+            index.build_lsh()
+        return index
+    
+    def _get_corpus_index(self, existing_claims: List[Dict[str, Any]]) -> _CorpusIndex:
+        """
+        Return the token index for existing_claims, reusing the last one
+        when the same claims (by id) are analyzed again.
+        """
         
-        if not tokens1 or not tokens2:
-            return 0.0
+        ids = tuple(claim.get('id') for claim in existing_claims)
+        if not all(ids):
+            # Without ids there is no safe cache key
+            return _CorpusIndex(existing_claims, self._tokenize)
         
-        # Jaccard similarity
-        intersection = len(tokens1.intersection(tokens2))
-        union = len(tokens1.union(tokens2))
-        token_similarity = intersection / union if union > 0 else 0.0
+        if self._corpus_index is None or self._corpus_key != ids:
+            self._corpus_index = _CorpusIndex(existing_claims, self._tokenize)
+            self._corpus_key = ids
+        return self._corpus_index
+    
+    async def _bounded_semantic_similarity(
+        self,
+        text1: str,
+        text2: str,
+        tokens1: Optional[frozenset] = None,
+        tokens2: Optional[frozenset] = None
+    ) -> float:
+        """_calculate_semantic_similarity under the detector's concurrency limit"""
         
-        # Method 2: Semantic similarity (using LLM if available)
-        semantic_similarity = await self._calculate_semantic_similarity(text1, text2)
+        async with self._llm_semaphore:
+            return await self._calculate_semantic_similarity(text1, text2, tokens1, tokens2)
+    
+    async def _get_similarity_chat(self):
+        """
+        Return a similarity LLM chat for a single comparison.
         
-        # Combine scores (60% semantic, 40% token)
-        combined_similarity = (semantic_similarity * 0.6) + (token_similarity * 0.4)
+        LlmChat keeps conversation history per session, so each pair gets
+        its own session; pairs compared concurrently must not share one.
+        """
         
-        return min(1.0, max(0.0, combined_similarity))
+        from emergentintegrations.llm.chat import LlmChat
+        
+        return LlmChat(
+            api_key=self.api_key,
+            session_id=f"similarity-{uuid.uuid4().hex}",
+            system_message=SIMILARITY_SYSTEM_MSG
+        ).with_model("openai", "gpt-4o-mini")
     
     async def _calculate_semantic_similarity(
         self,
         text1: str,
-        text2: str
+        text2: str,
+        tokens1: Optional[frozenset] = None,
+        tokens2: Optional[frozenset] = None
     ) -> float:
         """
         Calculate semantic similarity using LLM.
@@ -186,26 +581,12 @@ class OriginalityDetector:
         """
         
         if not self.api_key:
-            return self._calculate_semantic_similarity_fallback(text1, text2)
+            return self._calculate_semantic_similarity_fallback(text1, text2, tokens1, tokens2)
         
         try:
-            from emergentintegrations.llm.chat import LlmChat, UserMessage
-            import json
+            from emergentintegrations.llm.chat import UserMessage
             
-            chat = LlmChat(
-                api_key=self.api_key,
-                session_id=f"similarity-{datetime.now().timestamp()}",
-                system_message="""You are a semantic similarity analyzer.
-Compare two text snippets and determine how similar they are semantically (0-1 scale).
-Consider:
-- Same topic/subject
-- Same perspective or viewpoint
-- Similar claims or arguments
-- Paraphrasing vs original
-
-Respond ONLY with JSON:
-{"similarity": <0.0-1.0>, "reasoning": "brief explanation"}"""
-            ).with_model("openai", "gpt-4o-mini")
+            chat = await self._get_similarity_chat()
             
             prompt = f"Text 1: {text1[:200]}\n\nText 2: {text2[:200]}"
             response = await chat.send_message(UserMessage(text=prompt))
@@ -217,30 +598,29 @@ Respond ONLY with JSON:
         except Exception as e:
             logger.warning(f"Semantic similarity calculation failed: {e}")
         
-        return self._calculate_semantic_similarity_fallback(text1, text2)
+        return self._calculate_semantic_similarity_fallback(text1, text2, tokens1, tokens2)
     
-    def _calculate_semantic_similarity_fallback(self, text1: str, text2: str) -> float:
+    def _calculate_semantic_similarity_fallback(
+        self,
+        text1: str,
+        text2: str,
+        tokens1: Optional[frozenset] = None,
+        tokens2: Optional[frozenset] = None
+    ) -> float:
         """
         Fallback semantic similarity using keyword analysis.
         """
         
         # Extract keywords
-        keywords1 = set(self._tokenize(text1))
-        keywords2 = set(self._tokenize(text2))
+        keywords1 = tokens1 if tokens1 is not None else frozenset(self._tokenize(text1))
+        keywords2 = tokens2 if tokens2 is not None else frozenset(self._tokenize(text2))
         
         if not keywords1 or not keywords2:
             return 0.0
         
         # Remove common words
-        common_words = {
-            'the', 'a', 'an', 'and', 'or', 'but', 'is', 'are', 'was', 'were',
-            'be', 'been', 'being', 'that', 'this', 'it', 'to', 'for', 'of', 'in',
-            'on', 'at', 'by', 'with', 'from', 'as', 'about', 'into', 'through',
-            'during', 'can', 'could', 'would', 'should', 'may', 'might', 'must'
-        }
-        
-        keywords1 = keywords1 - common_words
-        keywords2 = keywords2 - common_words
+        keywords1 = keywords1 - COMMON_WORDS
+        keywords2 = keywords2 - COMMON_WORDS
         
         if not keywords1 or not keywords2:
             return 0.0
@@ -345,32 +725,23 @@ Respond ONLY with JSON:
         Splits text into words, lowercases, removes punctuation.
         """
         
-        import string
-        
-        text = text.lower()
-        # Remove punctuation
-        text = text.translate(str.maketrans('', '', string.punctuation))
-        # Split into words
-        tokens = text.split()
-        
-        return tokens
+        # Lowercase, remove punctuation, split into words
+        return text.lower().translate(_PUNCTUATION_TABLE).split()
     
     @staticmethod
     def _parse_json_response(response: str) -> Optional[Dict[str, Any]]:
         """Parse JSON from LLM response"""
         
-        import json
-        
         try:
-            return json.loads(response)
+            return _loads(response)
         except json.JSONDecodeError:
             # Try to extract JSON
             start = response.find('{')
             end = response.rfind('}') + 1
             if start >= 0 and end > start:
                 try:
-                    return json.loads(response[start:end])
-                except:
+                    return _loads(response[start:end])
+                except ValueError:
                     pass
         
         return None
@@ -384,10 +755,24 @@ Respond ONLY with JSON:
         Calculate originality for multiple claims efficiently.
         """
         
-        results = []
-        
-        for claim in new_claims:
-            analysis = await self.analyze_originality(claim, existing_claims)
-            results.append(analysis)
-        
-        return results
+        # Existing claims are tokenized and indexed (and, for large corpora,
+        # LSH-bucketed) once for the whole batch
+        index = self.index_claims(existing_claims)
+        
+        # Below the LSH size every claim is scored against the whole corpus,
+        # so score them in batches that share one corpus traversal
+        overlaps: List[Optional[Tuple[np.ndarray, np.ndarray]]] = [None] * len(new_claims)
+        if len(index) < LSH_MIN_CORPUS:
+            token_sets = [frozenset(self._tokenize(claim.get('text', ''))) for claim in new_claims]
+            for start in range(0, len(new_claims), SIMILARITY_BATCH_SIZE):
+                batch = token_sets[start:start + SIMILARITY_BATCH_SIZE]
+                token_similarity, keyword_overlap = index.similarities_batch(batch)
+                for k in range(len(batch)):
+                    overlaps[start + k] = (token_similarity[k], keyword_overlap[k])
+        
+        # Claims are analyzed concurrently; LLM calls across all of them
+        # share the detector's concurrency limit
+        return list(await asyncio.gather(*[
+            self._analyze_against_index(claim, index, claim_overlaps)
+            for claim, claim_overlaps in zip(new_claims, overlaps)
+        ]))
@@ -1,8 +1,10 @@
 import asyncio
+from collections import Counter, defaultdict
 from motor.motor_asyncio import AsyncIOMotorClient
+from pymongo import WriteConcern
+from pymongo.errors import OperationFailure
 import os
 from datetime import datetime, timezone, timedelta
-import uuid
 import bcrypt
 from dotenv import load_dotenv
 from pathlib import Path
@@ -11,230 +13,293 @@ ROOT_DIR = Path(__file__).parent
 load_dotenv(ROOT_DIR / '.env')
 
 mongo_url = os.environ['MONGO_URL']
-client = AsyncIOMotorClient(mongo_url)
-db = client[os.environ['DB_NAME']]
 
-def hash_password(password: str) -> str:
-    return bcrypt.hashpw(password.encode('utf-8'), bcrypt.gensalt()).decode('utf-8')
+# The seeder runs at most a few operations at once, and should fail fast
+# rather than wait 30s when MONGO_URL is wrong
+SEED_MAX_POOL_SIZE = 16
+SEED_SERVER_SELECTION_TIMEOUT_MS = 5000
 
-async def seed_database():
-    print("Seeding database...")
-    
-    # Clear existing data
-    await db.users.delete_many({})
-    await db.claims.delete_many({})
-    await db.annotations.delete_many({})
-    await db.media.delete_many({})
-    
-    # Create users
-    users = []
-    user_data = [
-        {"username": "dr_scientist", "email": "scientist@example.com", "reputation": 85.0},
-        {"username": "fact_checker", "email": "checker@example.com", "reputation": 72.0},
-        {"username": "researcher_jane", "email": "jane@example.com", "reputation": 65.0},
-        {"username": "truth_seeker", "email": "seeker@example.com", "reputation": 45.0},
-        {"username": "skeptic_bob", "email": "bob@example.com", "reputation": 38.0},
-    ]
-    
-    for i, data in enumerate(user_data):
-        user_id = str(uuid.uuid4())
-        user = {
-            "id": user_id,
-            "username": data["username"],
-            "email": data["email"],
-            "password": hash_password("password123"),
-            "reputation_score": data["reputation"],
-            "contribution_stats": {
-                "claims_posted": 0,
-                "annotations_added": 0,
-                "helpful_votes_received": 0
-            },
-            "created_at": (datetime.now(timezone.utc) - timedelta(days=60-i*10)).isoformat()
-        }
-        await db.users.insert_one(user)
-        users.append(user)
+# bcrypt cost for the throwaway demo accounts; each step down halves the work,
+# and server.py keeps the library default for real passwords
+SEED_BCRYPT_ROUNDS = 4
+
+def hash_password(password: str, rounds: int = SEED_BCRYPT_ROUNDS) -> str:
+    return bcrypt.hashpw(password.encode('utf-8'), bcrypt.gensalt(rounds=rounds)).decode('utf-8')
+
+# Server error code for transactions on a standalone mongod
+ILLEGAL_OPERATION = 20
+
+async def insert_seed_documents(client, db, users, claims, annotations):
+    """
+    Insert the seed documents in one transaction where the deployment
+    supports it, so a failed run leaves nothing half-seeded.
     
-    print(f"Created {len(users)} users")
+    Standalone servers have no transactions; there the inserts are sent
+    without waiting for acknowledgement, as the documents are disposable.
+    """
+    try:
+        async with await client.start_session() as session:
+            async with session.start_transaction():
+                await db.users.insert_many(users, ordered=False, session=session)
+                await db.claims.insert_many(claims, ordered=False, session=session)
+                await db.annotations.insert_many(annotations, ordered=False, session=session)
+        return
+    except OperationFailure as e:
+        if e.code != ILLEGAL_OPERATION:
+            raise
     
-    # Create claims
-    claims_data = [
-        {
-            "text": "Climate change is primarily caused by human activities according to scientific consensus, with 97% of climate scientists agreeing.",
-            "domain": "Science",
-            "confidence": 90,
-            "days_ago": 5
-        },
-        {
-            "text": "Regular exercise for 30 minutes a day can reduce the risk of heart disease by up to 50% according to multiple health studies.",
-            "domain": "Health",
-            "confidence": 85,
-            "days_ago": 8
-        },
-        {
-            "text": "The Great Wall of China is visible from space with the naked eye.",
-            "domain": "History",
-            "confidence": 40,
-            "days_ago": 12
-        },
-        {
-            "text": "Vaccines have eliminated smallpox globally and reduced polio cases by 99% since 1988.",
-            "domain": "Health",
-            "confidence": 95,
-            "days_ago": 3
-        },
-        {
-            "text": "Renewable energy sources now account for over 30% of global electricity generation capacity.",
-            "domain": "Environment",
-            "confidence": 80,
-            "days_ago": 7
-        },
-        {
-            "text": "The human brain uses only 10% of its capacity.",
-            "domain": "Science",
-            "confidence": 30,
-            "days_ago": 15
-        },
-        {
-            "text": "Drinking 8 glasses of water per day is necessary for optimal health.",
-            "domain": "Health",
-            "confidence": 50,
-            "days_ago": 10
-        },
-        {
-            "text": "Electric vehicles produce zero emissions during operation.",
-            "domain": "Technology",
-            "confidence": 85,
-            "days_ago": 6
-        },
-        {
-            "text": "Studies show that reading before bed improves sleep quality and cognitive function.",
-            "domain": "Health",
-            "confidence": 70,
-            "days_ago": 9
-        },
-        {
-            "text": "The global poverty rate has declined by more than half since 1990 according to World Bank data.",
-            "domain": "Economics",
-            "confidence": 88,
-            "days_ago": 4
-        }
-    ]
+    # Transactions are unavailable and nothing was written. The deletes and
+    # indexes in seed_database were acknowledged, so they are done before
+    # any of these inserts arrive.
+    seed_db = db.with_options(write_concern=WriteConcern(w=0))
+    await seed_db.users.insert_many(users, ordered=False)
+    await seed_db.claims.insert_many(claims, ordered=False)
+    await seed_db.annotations.insert_many(annotations, ordered=False)
+
+# Annotation types cycled through for seeded annotations, and the canned
+# texts for each
+ANNOTATION_TYPES = ('support', 'contradict', 'context')
+ANNOTATION_TEXTS = {
+    'support': (
+        "Multiple peer-reviewed studies confirm this finding. See Nature Journal 2023.",
+        "This aligns with WHO guidelines and recommendations.",
+        "Independent research teams have replicated these results.",
+    ),
+    'contradict': (
+        "Recent studies suggest the numbers may be overstated.",
+        "This claim lacks sufficient evidence from credible sources.",
+        "Counter-evidence suggests a more nuanced interpretation.",
+    ),
+    'context': (
+        "It's important to note that results may vary based on individual circumstances.",
+        "This should be considered alongside other contributing factors.",
+        "The timeframe and methodology of the study are key to understanding this claim.",
+    ),
+}
+
+async def seed_database():
+    # Created here so the client binds to the loop that asyncio.run starts
+    client = AsyncIOMotorClient(
+        mongo_url,
+        maxPoolSize=SEED_MAX_POOL_SIZE,
+        serverSelectionTimeoutMS=SEED_SERVER_SELECTION_TIMEOUT_MS
+    )
+    db = client[os.environ['DB_NAME']]
     
-    claims = []
-    for i, claim_data in enumerate(claims_data):
-        claim_id = str(uuid.uuid4())
-        author = users[i % len(users)]
+    try:
+        print("Seeding database...")
         
-        claim = {
-            "id": claim_id,
-            "text": claim_data["text"],
-            "domain": claim_data["domain"],
-            "confidence_level": claim_data["confidence"],
-            "author_id": author['id'],
-            "media_ids": [],
-            "truth_label": "Uncertain",
-            "credibility_score": 0.0,
-            "created_at": (datetime.now(timezone.utc) - timedelta(days=claim_data["days_ago"])).isoformat()
-        }
-        await db.claims.insert_one(claim)
-        claims.append(claim)
+        # Single reference time, so every seeded timestamp is relative to the
+        # same instant
+        now = datetime.now(timezone.utc)
         
-        # Update user stats
-        await db.users.update_one(
-            {"id": author['id']},
-            {"$inc": {"contribution_stats.claims_posted": 1}}
+        # Clear existing data; the collections are independent, so the deletes
+        # run concurrently
+        await asyncio.gather(
+            db.users.delete_many({}),
+            db.claims.delete_many({}),
+            db.annotations.delete_many({}),
+            db.media.delete_many({})
         )
-    
-    print(f"Created {len(claims)} claims")
-    
-    # Create annotations for some claims
-    annotations_count = 0
-    
-    # Add annotations to first few claims to create variety
-    for i in range(5):
-        claim = claims[i]
-        num_annotations = (i % 3) + 2  # 2-4 annotations per claim
         
-        for j in range(num_annotations):
-            annotator = users[(i + j + 1) % len(users)]
-            annotation_id = str(uuid.uuid4())
-            
-            annotation_types = ['support', 'contradict', 'context']
-            ann_type = annotation_types[j % 3]
-            
-            annotation_texts = {
-                'support': [
-                    "Multiple peer-reviewed studies confirm this finding. See Nature Journal 2023.",
-                    "This aligns with WHO guidelines and recommendations.",
-                    "Independent research teams have replicated these results.",
-                ],
-                'contradict': [
-                    "Recent studies suggest the numbers may be overstated.",
-                    "This claim lacks sufficient evidence from credible sources.",
-                    "Counter-evidence suggests a more nuanced interpretation.",
-                ],
-                'context': [
-                    "It's important to note that results may vary based on individual circumstances.",
-                    "This should be considered alongside other contributing factors.",
-                    "The timeframe and methodology of the study are key to understanding this claim.",
-                ]
+        # Index the lookup fields used by the app while the collections are empty
+        await asyncio.gather(
+            db.users.create_index([("id", 1)], unique=True),
+            db.claims.create_index([("id", 1)], unique=True),
+            db.claims.create_index([("author_id", 1)]),
+            db.annotations.create_index([("id", 1)], unique=True),
+            db.annotations.create_index([("claim_id", 1)])
+        )
+        
+        # Create users
+        users = []
+        user_data = [
+            {"username": "dr_scientist", "email": "scientist@example.com", "reputation": 85.0},
+            {"username": "fact_checker", "email": "checker@example.com", "reputation": 72.0},
+            {"username": "researcher_jane", "email": "jane@example.com", "reputation": 65.0},
+            {"username": "truth_seeker", "email": "seeker@example.com", "reputation": 45.0},
+            {"username": "skeptic_bob", "email": "bob@example.com", "reputation": 38.0},
+        ]
+        
+        # Every demo account shares the same password, so hash it once
+        password_hash = hash_password("password123")
+        
+        for i, data in enumerate(user_data):
+            user_id = f"seed-user-{i:03d}"
+            user = {
+                "id": user_id,
+                "username": data["username"],
+                "email": data["email"],
+                "password": password_hash,
+                "reputation_score": data["reputation"],
+                "contribution_stats": {
+                    "claims_posted": 0,
+                    "annotations_added": 0,
+                    "helpful_votes_received": 0
+                },
+                "created_at": (now - timedelta(days=60-i*10)).isoformat()
+            }
+            users.append(user)
+        
+        # Create claims
+        claims_data = [
+            {
+                "text": "Climate change is primarily caused by human activities according to scientific consensus, with 97% of climate scientists agreeing.",
+                "domain": "Science",
+                "confidence": 90,
+                "days_ago": 5
+            },
+            {
+                "text": "Regular exercise for 30 minutes a day can reduce the risk of heart disease by up to 50% according to multiple health studies.",
+                "domain": "Health",
+                "confidence": 85,
+                "days_ago": 8
+            },
+            {
+                "text": "The Great Wall of China is visible from space with the naked eye.",
+                "domain": "History",
+                "confidence": 40,
+                "days_ago": 12
+            },
+            {
+                "text": "Vaccines have eliminated smallpox globally and reduced polio cases by 99% since 1988.",
+                "domain": "Health",
+                "confidence": 95,
+                "days_ago": 3
+            },
+            {
+                "text": "Renewable energy sources now account for over 30% of global electricity generation capacity.",
+                "domain": "Environment",
+                "confidence": 80,
+                "days_ago": 7
+            },
+            {
+                "text": "The human brain uses only 10% of its capacity.",
+                "domain": "Science",
+                "confidence": 30,
+                "days_ago": 15
+            },
+            {
+                "text": "Drinking 8 glasses of water per day is necessary for optimal health.",
+                "domain": "Health",
+                "confidence": 50,
+                "days_ago": 10
+            },
+            {
+                "text": "Electric vehicles produce zero emissions during operation.",
+                "domain": "Technology",
+                "confidence": 85,
+                "days_ago": 6
+            },
+            {
+                "text": "Studies show that reading before bed improves sleep quality and cognitive function.",
+                "domain": "Health",
+                "confidence": 70,
+                "days_ago": 9
+            },
+            {
+                "text": "The global poverty rate has declined by more than half since 1990 according to World Bank data.",
+                "domain": "Economics",
+                "confidence": 88,
+                "days_ago": 4
             }
+        ]
+        
+        claims = []
+        for i, claim_data in enumerate(claims_data):
+            claim_id = f"seed-claim-{i:03d}"
+            author = users[i % len(users)]
             
-            annotation = {
-                "id": annotation_id,
-                "claim_id": claim['id'],
-                "author_id": annotator['id'],
-                "text": annotation_texts[ann_type][j % 3],
-                "annotation_type": ann_type,
+            claim = {
+                "id": claim_id,
+                "text": claim_data["text"],
+                "domain": claim_data["domain"],
+                "confidence_level": claim_data["confidence"],
+                "author_id": author['id'],
                 "media_ids": [],
-                "helpful_votes": 0,
-                "not_helpful_votes": 0,
-                "voted_by": [],
-                "created_at": (datetime.now(timezone.utc) - timedelta(days=claim_data["days_ago"]-1, hours=j*6)).isoformat()
+                "truth_label": "Uncertain",
+                "credibility_score": 0.0,
+                "created_at": (now - timedelta(days=claim_data["days_ago"])).isoformat()
             }
-            await db.annotations.insert_one(annotation)
-            annotations_count += 1
+            claims.append(claim)
             
-            # Update user stats
-            await db.users.update_one(
-                {"id": annotator['id']},
-                {"$inc": {"contribution_stats.annotations_added": 1}}
-            )
-    
-    print(f"Created {annotations_count} annotations")
-    
-    # Recalculate credibility scores for claims with annotations
-    for claim in claims[:5]:
-        annotations = await db.annotations.find({"claim_id": claim['id']}, {"_id": 0}).to_list(length=1000)
+            # Update user stats (counted in memory; users are inserted last)
+            author['contribution_stats']['claims_posted'] += 1
+        
+        # Create annotations for some claims
+        annotations = []
+        # Annotation types per claim ID, for the credibility pass
+        annotation_types_by_claim = defaultdict(Counter)
         
-        if len(annotations) >= 3:
-            support_count = sum(1 for a in annotations if a['annotation_type'] == 'support')
-            contradict_count = sum(1 for a in annotations if a['annotation_type'] == 'contradict')
-            total = support_count + contradict_count
+        # Add annotations to first few claims to create variety
+        for i in range(5):
+            claim = claims[i]
+            claim_days_ago = claims_data[i]["days_ago"]
+            num_annotations = (i % 3) + 2  # 2-4 annotations per claim
             
-            if total > 0:
-                support_ratio = support_count / total
-                credibility = support_ratio * 100
+            for j in range(num_annotations):
+                annotator = users[(i + j + 1) % len(users)]
+                annotation_id = f"seed-annotation-{len(annotations):03d}"
                 
-                # Determine truth label
-                if support_ratio >= 0.85:
-                    label = "True"
-                elif support_ratio >= 0.65:
-                    label = "Likely True"
-                elif support_ratio >= 0.45:
-                    label = "Mixed Evidence"
-                elif support_ratio >= 0.25:
-                    label = "Likely False"
-                else:
-                    label = "False"
+                ann_type = ANNOTATION_TYPES[j % 3]
                 
-                await db.claims.update_one(
-                    {"id": claim['id']},
-                    {"$set": {"credibility_score": credibility, "truth_label": label}}
-                )
-    
-    print("Database seeded successfully!")
-    client.close()
+                annotation = {
+                    "id": annotation_id,
+                    "claim_id": claim['id'],
+                    "author_id": annotator['id'],
+                    "text": ANNOTATION_TEXTS[ann_type][j % 3],
+                    "annotation_type": ann_type,
+                    "media_ids": [],
+                    "helpful_votes": 0,
+                    "not_helpful_votes": 0,
+                    "voted_by": [],
+                    "created_at": (now - timedelta(days=claim_days_ago-1, hours=j*6)).isoformat()
+                }
+                annotations.append(annotation)
+                annotation_types_by_claim[claim['id']][ann_type] += 1
+                
+                # Update user stats
+                annotator['contribution_stats']['annotations_added'] += 1
+        
+        # Score claims with annotations before anything is written, so claims
+        # are inserted with their final credibility and label
+        for claim in claims[:5]:
+            type_counts = annotation_types_by_claim[claim['id']]
+            
+            if sum(type_counts.values()) >= 3:
+                support_count = type_counts['support']
+                contradict_count = type_counts['contradict']
+                total = support_count + contradict_count
+                
+                if total > 0:
+                    support_ratio = support_count / total
+                    credibility = support_ratio * 100
+                    
+                    # Determine truth label
+                    if support_ratio >= 0.85:
+                        label = "True"
+                    elif support_ratio >= 0.65:
+                        label = "Likely True"
+                    elif support_ratio >= 0.45:
+                        label = "Mixed Evidence"
+                    elif support_ratio >= 0.25:
+                        label = "Likely False"
+                    else:
+                        label = "False"
+                    
+                    claim['credibility_score'] = credibility
+                    claim['truth_label'] = label
+        
+        # Users go in with their final contribution stats, so no per-document
+        # $inc updates are needed
+        await insert_seed_documents(client, db, users, claims, annotations)
+        print(f"Created {len(users)} users")
+        print(f"Created {len(claims)} claims")
+        print(f"Created {len(annotations)} annotations")
+        
+        print("Database seeded successfully!")
+    finally:
+        client.close()
 
 if __name__ == "__main__":
     asyncio.run(seed_database())
@@ -20,17 +20,30 @@ from slowapi.errors import RateLimitExceeded
 import os
 import logging
 from pathlib import Path
+from dataclasses import asdict
 from pydantic import BaseModel, Field, ConfigDict
 from typing import List, Optional, Dict, Any
 import uuid
 from datetime import datetime, timezone, timedelta
 import bcrypt
+import hmac
+import hashlib
+import secrets
+import time
 import jwt
-import requests
+import httpx
 import io
+import shutil
 from enum import Enum
 import asyncio
 
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
 # Import AI Reputation Evaluator
 from ai_reputation_evaluator import evaluate_claim_for_reputation, EvaluationResult
 
@@ -48,7 +61,7 @@ from annotation_validator import classify_annotation_type
 
 # Import new Thrryv v1 features
 from content_discovery import ContentDiscoveryEngine, DiscoveryAlgorithm
-from content_signals import ContentSignalGenerator
+from content_signals import get_default_generator
 from user_standing import UserStandingSystem, StandingTier
 from originality_detection import OriginalityDetector
 from natural_language_search import NaturalLanguageSearchEngine
@@ -110,6 +123,35 @@ security = HTTPBearer()
 UPLOAD_DIR = ROOT_DIR / 'uploads'
 UPLOAD_DIR.mkdir(exist_ok=True)
 
+# Uploads are copied to disk in chunks of this size rather than read whole
+UPLOAD_CHUNK_SIZE = 1024 * 1024
+
+# Annotations joined into each feed claim: capped like the old per-claim
+# query, and trimmed to the fields calculate_post_score and the feed cards
+# read, so a heavily annotated claim stays far below the 16 MB document limit
+FEED_ANNOTATION_LIMIT = 1000
+FEED_ANNOTATION_FIELDS = {
+    "_id": 0,
+    "id": 1,
+    "author_id": 1,
+    "author": 1,
+    "author_reputation": 1,
+    "text": 1,
+    "annotation_type": 1,
+    "classification_confidence": 1,
+    "helpful_votes": 1,
+    "not_helpful_votes": 1,
+    "created_at": 1,
+}
+
+# Hive AI detection endpoint, called through one shared client so uploads
+# reuse pooled keep-alive connections rather than a fresh TLS handshake each
+HIVE_API_URL = "https://api.hivemoderation.com/api/v1/functions/image_check"
+hive_client = httpx.AsyncClient(
+    timeout=30,
+    limits=httpx.Limits(max_keepalive_connections=50)
+)
+
 # Initialize rate limiter
 limiter = Limiter(key_func=get_remote_address)
 
@@ -212,11 +254,51 @@ class ChallengePredictionRequest(BaseModel):
     confidence_level: Optional[float] = 50.0
 
 # Auth utilities
-def hash_password(password: str) -> str:
-    return bcrypt.hashpw(password.encode('utf-8'), bcrypt.gensalt()).decode('utf-8')
 
-def verify_password(password: str, hashed: str) -> bool:
-    return bcrypt.checkpw(password.encode('utf-8'), hashed.encode('utf-8'))
+# Recently verified (password, hash) pairs, so repeat logins skip bcrypt.
+# Entries are keyed by an HMAC under a per-process secret, so neither
+# passwords nor anything brute-forceable offline is held in memory, and a
+# password change alters the hash and therefore the key.
+PASSWORD_CACHE_SIZE = 4096
+PASSWORD_CACHE_TTL_SECONDS = 300
+_password_cache_secret = secrets.token_bytes(32)
+_verified_passwords: "OrderedDict[bytes, float]" = OrderedDict()
+
+# bcrypt releases the GIL while hashing, so a thread per core runs checks
+# in parallel without blocking the event loop
+bcrypt_pool = ThreadPoolExecutor(max_workers=os.cpu_count())
+
+async def hash_password(password: str) -> str:
+    loop = asyncio.get_running_loop()
+    hashed = await loop.run_in_executor(
+        bcrypt_pool, bcrypt.hashpw, password.encode('utf-8'), bcrypt.gensalt()
+    )
+    return hashed.decode('utf-8')
+
+def _password_cache_key(password: str, hashed: str) -> bytes:
+    message = password.encode('utf-8') + b'\0' + hashed.encode('utf-8')
+    return hmac.new(_password_cache_secret, message, hashlib.sha256).digest()
+
+async def verify_password(password: str, hashed: str) -> bool:
+    key = _password_cache_key(password, hashed)
+    expiry = _verified_passwords.get(key)
+    if expiry is not None:
+        if expiry > time.monotonic():
+            _verified_passwords.move_to_end(key)
+            return True
+        del _verified_passwords[key]
+    
+    loop = asyncio.get_running_loop()
+    valid = await loop.run_in_executor(
+        bcrypt_pool, bcrypt.checkpw, password.encode('utf-8'), hashed.encode('utf-8')
+    )
+    
+    # Only successes are cached; failed guesses always pay the full bcrypt cost
+    if valid:
+        _verified_passwords[key] = time.monotonic() + PASSWORD_CACHE_TTL_SECONDS
+        if len(_verified_passwords) > PASSWORD_CACHE_SIZE:
+            _verified_passwords.popitem(last=False)
+    return valid
 
 def create_jwt_token(user_id: str) -> str:
     expiration = datetime.now(timezone.utc) + timedelta(hours=JWT_EXPIRATION_HOURS)
@@ -253,6 +335,25 @@ async def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(s
     return user
 
 # AI Detection (Hive AI)
+def _upload_size(file: UploadFile) -> int:
+    """Size of an upload, from the parser or by seeking its spooled file"""
+    if file.size is not None:
+        return file.size
+    file.file.seek(0, io.SEEK_END)
+    size = file.file.tell()
+    file.file.seek(0)
+    return size
+
+def _copy_upload(source, file_path: Path) -> None:
+    """Copy an upload's spooled file to disk chunk by chunk"""
+    source.seek(0)
+    with open(file_path, 'wb') as out:
+        shutil.copyfileobj(source, out, UPLOAD_CHUNK_SIZE)
+
+async def save_upload(file: UploadFile, file_path: Path) -> None:
+    """Save an upload without buffering it in memory or blocking the loop"""
+    await asyncio.to_thread(_copy_upload, file.file, file_path)
+
 async def detect_ai_content(file_path: str, file_type: str) -> tuple[bool, float]:
     """Detect AI-generated content using Hive AI API"""
     hive_api_key = os.environ.get('HIVE_API_KEY')
@@ -262,16 +363,17 @@ async def detect_ai_content(file_path: str, file_type: str) -> tuple[bool, float
         return False, 0.0
     
     try:
-        url = "https://api.hivemoderation.com/api/v1/functions/image_check"
         headers = {
             "authorization": f"token {hive_api_key}",
             "accept": "application/json"
         }
         
-        with open(file_path, "rb") as f:
-            files = {'image': (Path(file_path).name, f, file_type)}
-            response = requests.post(url, files=files, headers=headers, timeout=30)
-            response.raise_for_status()
+        # Read off the event loop and await the upload, so other requests
+        # keep being served while Hive responds
+        contents = await asyncio.to_thread(Path(file_path).read_bytes)
+        files = {'image': (Path(file_path).name, contents, file_type)}
+        response = await hive_client.post(HIVE_API_URL, files=files, headers=headers)
+        response.raise_for_status()
         
         data = response.json()
         
@@ -379,7 +481,7 @@ async def register(request: Request, user_data: UserCreate):
         raise HTTPException(status_code=400, detail="Username already taken")
     
     user_id = str(uuid.uuid4())
-    hashed_pw = hash_password(password)
+    hashed_pw = await hash_password(password)
     
     user = {
         "id": user_id,
@@ -413,7 +515,7 @@ async def register(request: Request, user_data: UserCreate):
 @limiter.limit("10/minute")  # Prevent brute force attacks
 async def login(request: Request, credentials: UserLogin):
     user = await db.users.find_one({"email": credentials.email}, {"_id": 0})
-    if not user or not verify_password(credentials.password, user['password']):
+    if not user or not await verify_password(credentials.password, user['password']):
         raise HTTPException(status_code=401, detail="Invalid email or password")
     
     token = create_jwt_token(user['id'])
@@ -451,8 +553,7 @@ async def upload_media(
     current_user = Depends(get_current_user)
 ):
     # Validate file
-    contents = await file.read()
-    validate_media_file(file.filename, file.content_type, len(contents))
+    validate_media_file(file.filename, file.content_type, _upload_size(file))
     
     file_id = str(uuid.uuid4())
     file_ext = Path(file.filename).suffix.lower()
@@ -465,8 +566,7 @@ async def upload_media(
     file_path = UPLOAD_DIR / f"{file_id}{file_ext}"
     
     # Save file
-    with open(file_path, 'wb') as f:
-        f.write(contents)
+    await save_upload(file, file_path)
     
     # Detect AI-generated content
     is_ai, confidence = await detect_ai_content(str(file_path), file.content_type)
@@ -597,27 +697,55 @@ Respond ONLY with a JSON object:
         return await classify_claim_domain_fallback(claim_text)
 
 
+# Keywords for the fallback domain classifier; a domain scores one point per
+# distinct keyword found in the claim
+DOMAIN_FALLBACK_KEYWORDS = {
+    "Science": ["scientific", "research", "study", "evidence", "experiment", "data", "scientists", "biology", "physics", "chemistry", "nasa", "rover", "mars", "space"],
+    "Health": ["health", "medical", "disease", "vaccine", "treatment", "medicine", "exercise", "wellness", "mental", "physical", "doctor", "hospital"],
+    "Technology": ["technology", "tech", "software", "digital", "computer", "internet", "AI", "electric", "innovation", "device", "app", "smartphone"],
+    "Politics": ["political", "government", "election", "policy", "law", "president", "congress", "vote", "democracy", "parliament", "senator"],
+    "Economics": ["economic", "economy", "financial", "market", "trade", "poverty", "wealth", "GDP", "inflation", "business", "stock", "investment"],
+    "Environment": ["environment", "climate", "pollution", "renewable", "energy", "nature", "conservation", "sustainability", "carbon", "emissions"],
+    "History": ["historical", "history", "ancient", "past", "century", "war", "empire", "civilization", "pyramids", "medieval", "dynasty"],
+    "Society": ["social", "society", "culture", "community", "people", "demographic", "population", "equality", "rights"],
+    "Sports": ["sport", "football", "basketball", "soccer", "olympics", "athlete", "team", "championship", "match", "player"],
+    "Entertainment": ["movie", "film", "music", "celebrity", "actor", "singer", "concert", "album", "game", "netflix"],
+    "Geography": ["country", "city", "continent", "river", "mountain", "ocean", "india", "china", "america", "europe", "kolkata", "delhi"]
+}
+
+
+def _build_domain_keyword_automaton():
+    """One Aho-Corasick automaton over every fallback domain keyword"""
+    automaton = ahocorasick.Automaton()
+    for keywords in DOMAIN_FALLBACK_KEYWORDS.values():
+        for keyword in keywords:
+            automaton.add_word(keyword, keyword)
+    automaton.make_automaton()
+    return automaton
+
+_DOMAIN_KEYWORD_AUTOMATON = _build_domain_keyword_automaton() if ahocorasick is not None else None
+
+
 async def classify_claim_domain_fallback(claim_text: str) -> str:
     """Fallback keyword-based classification"""
-    domains_keywords = {
-        "Science": ["scientific", "research", "study", "evidence", "experiment", "data", "scientists", "biology", "physics", "chemistry", "nasa", "rover", "mars", "space"],
-        "Health": ["health", "medical", "disease", "vaccine", "treatment", "medicine", "exercise", "wellness", "mental", "physical", "doctor", "hospital"],
-        "Technology": ["technology", "tech", "software", "digital", "computer", "internet", "AI", "electric", "innovation", "device", "app", "smartphone"],
-        "Politics": ["political", "government", "election", "policy", "law", "president", "congress", "vote", "democracy", "parliament", "senator"],
-        "Economics": ["economic", "economy", "financial", "market", "trade", "poverty", "wealth", "GDP", "inflation", "business", "stock", "investment"],
-        "Environment": ["environment", "climate", "pollution", "renewable", "energy", "nature", "conservation", "sustainability", "carbon", "emissions"],
-        "History": ["historical", "history", "ancient", "past", "century", "war", "empire", "civilization", "pyramids", "medieval", "dynasty"],
-        "Society": ["social", "society", "culture", "community", "people", "demographic", "population", "equality", "rights"],
-        "Sports": ["sport", "football", "basketball", "soccer", "olympics", "athlete", "team", "championship", "match", "player"],
-        "Entertainment": ["movie", "film", "music", "celebrity", "actor", "singer", "concert", "album", "game", "netflix"],
-        "Geography": ["country", "city", "continent", "river", "mountain", "ocean", "india", "china", "america", "europe", "kolkata", "delhi"]
-    }
-    
     claim_lower = claim_text.lower()
+    
+    # Every keyword occurring in the claim, from a single pass over the text
+    # when pyahocorasick is installed
+    if _DOMAIN_KEYWORD_AUTOMATON is not None:
+        found = {keyword for _, keyword in _DOMAIN_KEYWORD_AUTOMATON.iter(claim_lower)}
+    else:
+        found = {
+            keyword
+            for keywords in DOMAIN_FALLBACK_KEYWORDS.values()
+            for keyword in keywords
+            if keyword in claim_lower
+        }
+    
     domain_scores = {}
     
-    for domain, keywords in domains_keywords.items():
-        score = sum(1 for keyword in keywords if keyword in claim_lower)
+    for domain, keywords in DOMAIN_FALLBACK_KEYWORDS.items():
+        score = sum(1 for keyword in keywords if keyword in found)
         if score > 0:
             domain_scores[domain] = score
     
@@ -796,18 +924,56 @@ async def create_claim(
 
 @api_router.get("/claims")
 async def get_claims(limit: int = 20, offset: int = 0):
-    claims = await db.claims.find({}, {"_id": 0}).sort("created_at", -1).skip(offset).limit(limit).to_list(length=limit)
+    # Join each page of claims with its author, media, annotations and
+    # annotation authors on the server, in one round-trip
+    pipeline = [
+        {"$sort": {"created_at": -1}},
+        {"$skip": offset},
+        {"$limit": limit},
+        {"$lookup": {"from": "users", "localField": "author_id", "foreignField": "id", "as": "author"}},
+        {"$lookup": {"from": "media", "localField": "media_ids", "foreignField": "id", "as": "media"}},
+        {"$lookup": {
+            "from": "annotations",
+            "localField": "id",
+            "foreignField": "claim_id",
+            "pipeline": [
+                {"$limit": FEED_ANNOTATION_LIMIT},
+                {"$project": FEED_ANNOTATION_FIELDS}
+            ],
+            "as": "annotations"
+        }},
+        {"$lookup": {"from": "users", "localField": "annotations.author_id", "foreignField": "id", "as": "annotation_authors"}},
+        {"$addFields": {
+            "author": {"$arrayElemAt": ["$author", 0]},
+            "annotation_authors": {"$map": {
+                "input": "$annotation_authors",
+                "as": "u",
+                "in": {"id": "$$u.id", "username": "$$u.username"}
+            }}
+        }},
+        {"$project": {
+            "_id": 0,
+            "author._id": 0,
+            "author.password": 0,
+            "media._id": 0
+        }}
+    ]
+    claims = await db.claims.aggregate(pipeline).to_list(length=limit)
     
     result = []
     for claim in claims:
-        author = await db.users.find_one({"id": claim['author_id']}, {"_id": 0, "password": 0})
-        annotations = await db.annotations.find({"claim_id": claim['id']}, {"_id": 0}).to_list(length=1000)
+        author = claim.get('author')
+        annotations = claim['annotations']
+        annotation_authors = {u['id']: u for u in claim['annotation_authors']}
         
-        media_list = []
-        for media_id in claim.get('media_ids', []):
-            media = await db.media.find_one({"id": media_id}, {"_id": 0})
-            if media:
-                media_list.append(media)
+        # $lookup returns each referenced media record once, in collection
+        # order; rebuild the list in the claim's own media_ids order
+        media_by_id = {m['id']: m for m in claim['media']}
+        media_list = [
+            media_by_id[media_id]
+            for media_id in claim.get('media_ids', [])
+            if media_id in media_by_id
+        ]
         
         # Calculate current post score
         post_score = calculate_post_score(annotations, claim.get('baseline_evaluation'), claim.get('author_id'))
@@ -820,7 +986,7 @@ async def get_claims(limit: int = 20, offset: int = 0):
         )[:2]
         top_annotation_cards = []
         for ann in top_annotations:
-            ann_author = await db.users.find_one({"id": ann['author_id']}, {"_id": 0, "password": 0})
+            ann_author = annotation_authors.get(ann['author_id'])
             top_annotation_cards.append({
                 "id": ann['id'],
                 "text": ann['text'],
@@ -1122,9 +1288,7 @@ async def upload_profile_picture(
     file_path = UPLOAD_DIR / f"profile_{file_id}{file_ext}"
     
     # Save file
-    contents = await file.read()
-    with open(file_path, 'wb') as f:
-        f.write(contents)
+    await save_upload(file, file_path)
     
     # Update user's profile picture
     await db.users.update_one(
@@ -1183,10 +1347,10 @@ async def update_user_settings(
     
     # Update password
     if current_password and new_password:
-        if not verify_password(current_password, current_user['password']):
+        if not await verify_password(current_password, current_user['password']):
             raise HTTPException(status_code=400, detail="Current password is incorrect")
         new_password = InputValidator.validate_password(new_password)
-        updates["password"] = hash_password(new_password)
+        updates["password"] = await hash_password(new_password)
     
     if updates:
         await db.users.update_one(
@@ -1568,6 +1732,8 @@ async def shutdown_db_client():
     if client:
         client.close()
         logger.info("Database connection closed")
+    await hive_client.aclose()
+    await get_default_generator().aclose()
 
 # Initialize additional collections for Thrryv v1 features
 @app.on_event("startup")
@@ -1603,6 +1769,11 @@ async def initialize_new_collections():
             await db.user_standing_records.create_index([("user_id", 1)])
             await db.user_standing_records.create_index([("updated_at", -1)])
             
+            # Media records are deleted and looked up by id during cleanup,
+            # and old-media cleanup joins claims on media_ids
+            await db.media.create_index([("id", 1)])
+            await db.claims.create_index([("media_ids", 1)])
+            
             logger.info("Thrryv v1 collections initialized successfully")
         
         except Exception as e:
@@ -1719,7 +1890,7 @@ async def get_content_signals(
     sources = claim.get('sources', [])
     
     try:
-        signal_generator = ContentSignalGenerator()
+        signal_generator = get_default_generator()
         feedback = await signal_generator.generate_feedback(
             claim=claim,
             annotations=annotations,
@@ -1891,7 +2062,7 @@ async def create_challenge(
         
         # Store challenge
         challenge_doc = {
-            **challenge.__dict__,
+            **asdict(challenge),
             "status": challenge.status.value
         }
         await db.challenges.insert_one(challenge_doc)
@@ -1937,7 +2108,7 @@ async def make_prediction(
         )
         
         # Store prediction
-        prediction_doc = prediction.__dict__
+        prediction_doc = asdict(prediction)
         await db.predictions.insert_one(prediction_doc)
         
         # Update challenge prediction count
@@ -0,0 +1,56 @@
+"""
+Shared Test Fixtures
+Fixtures for: fake LLM client
+"""
+import asyncio
+import sys
+import types
+
+import pytest
+
+
+class FakeLlm:
+    """Records every fake LlmChat created and answers messages with `reply`"""
+
+    def __init__(self):
+        self.sessions = []
+        # Reply text, or a callable mapping the sent text to a reply
+        self.reply = "{}"
+
+
+class _RecordingChat:
+    """LlmChat stand-in that records its session and every message sent"""
+
+    llm: FakeLlm = None
+
+    def __init__(self, api_key=None, session_id=None, system_message=None):
+        self.session_id = session_id
+        self.history = []
+        self.llm.sessions.append(self)
+
+    def with_model(self, *args):
+        return self
+
+    async def send_message(self, message):
+        self.history.append(message.text)
+        await asyncio.sleep(0)
+        reply = self.llm.reply
+        return reply(message.text) if callable(reply) else reply
+
+
+class _UserMessage:
+    def __init__(self, text=None):
+        self.text = text
+
+
+@pytest.fixture
+def fake_llm(monkeypatch):
+    """Install a fake emergentintegrations.llm.chat module for one test"""
+    llm = FakeLlm()
+    chat_module = types.ModuleType("emergentintegrations.llm.chat")
+    chat_module.LlmChat = type("LlmChat", (_RecordingChat,), {"llm": llm})
+    chat_module.UserMessage = _UserMessage
+    monkeypatch.setitem(sys.modules, "emergentintegrations", types.ModuleType("emergentintegrations"))
+    monkeypatch.setitem(sys.modules, "emergentintegrations.llm", types.ModuleType("emergentintegrations.llm"))
+    monkeypatch.setitem(sys.modules, "emergentintegrations.llm.chat", chat_module)
+    return llm
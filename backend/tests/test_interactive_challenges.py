@@ -0,0 +1,52 @@
+"""
+Interactive Challenges Tests
+Tests for: cached challenge display, prediction interning
+"""
+import asyncio
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from interactive_challenges import _INTERNED_VALUES, InteractiveChallengeSystem
+
+
+class TestChallengeDisplay:
+    """Challenge payloads built from the shared display cache"""
+
+    def setup_method(self):
+        self.system = InteractiveChallengeSystem()
+        self.challenge = asyncio.run(self.system.create_challenge("claim", "creator", {"title": "Will it rain?"}))
+
+    def test_viewer_changes_do_not_leak_between_payloads(self):
+        """Editing one viewer's payload leaves the next viewer's untouched"""
+        first = self.system.format_challenge_for_display(self.challenge)
+        first["participation_stats"]["predictions"] = 99
+        first["title"] = "edited"
+
+        second = self.system.format_challenge_for_display(self.challenge)
+
+        assert second["participation_stats"] == {"predictions": 0, "participants": 0}
+        assert second["title"] == "Will it rain?"
+        assert second["participation_stats"] is not first["participation_stats"]
+
+    def test_shared_options_are_immutable(self):
+        """The cached options cannot be changed in place"""
+        display = self.system.format_challenge_for_display(self.challenge)
+
+        assert display["options"] == ("Yes", "No", "Unsure")
+        assert not hasattr(display["options"], "append")
+
+
+class TestPredictionInterning:
+    """Shared string objects for common prediction values"""
+
+    def test_default_options_use_the_fast_path(self):
+        """Every default option label, as created on a challenge, is pre-interned"""
+        system = InteractiveChallengeSystem()
+        challenge = asyncio.run(system.create_challenge("claim", "creator", {}))
+
+        assert set(challenge.options) <= set(_INTERNED_VALUES)
+
+        prediction = asyncio.run(system.make_prediction(challenge.id, "user", challenge.options[0]))
+        assert prediction.prediction is _INTERNED_VALUES[challenge.options[0]]
@@ -0,0 +1,97 @@
+"""
+Natural Language Search Tests
+Tests for: time range filtering of search results, intent LLM sessions, LLM JSON parsing
+"""
+import asyncio
+import sys
+from dataclasses import replace
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from natural_language_search import NaturalLanguageSearchEngine
+
+
+def _claim(claim_id, created_at):
+    return {"id": claim_id, "domain": "Science", "quality_score": 80, "created_at": created_at}
+
+
+class TestTimeRangeFilter:
+    """Time range filtering in execute_search"""
+
+    def setup_method(self):
+        self.engine = NaturalLanguageSearchEngine(api_key="")
+
+    def test_claim_created_now_matches_today(self):
+        """A claim created a moment ago is inside a "today" search"""
+        now = datetime.now(timezone.utc)
+        intent = self.engine._parse_search_intent_fallback("claims from today")
+        assert intent.time_range is not None
+
+        claims = [_claim("now", now.isoformat())]
+        results = asyncio.run(self.engine.execute_search(intent, claims))
+
+        assert [c["id"] for c in results] == ["now"]
+
+    def test_date_only_end_covers_whole_day(self):
+        """A date-only "to" includes that entire UTC day, and nothing after"""
+        intent = self.engine._parse_search_intent_fallback("anything")
+        intent = replace(intent, time_range={"from": "2026-03-01", "to": "2026-03-02"})
+
+        claims = [
+            _claim("before", "2026-02-28T23:59:59+00:00"),
+            _claim("start", "2026-03-01T00:00:00+00:00"),
+            _claim("late", "2026-03-02T23:59:59.999000+00:00"),
+            _claim("after", "2026-03-03T00:00:00+00:00"),
+            _claim("offset", "2026-03-02T20:00:00-05:00"),  # 01:00 UTC on the 3rd
+        ]
+        results = asyncio.run(self.engine.execute_search(intent, claims))
+
+        assert sorted(c["id"] for c in results) == ["late", "start"]
+
+    def test_timestamp_end_is_inclusive(self):
+        """A "to" with a time part includes a claim created at exactly that instant"""
+        end = datetime(2026, 3, 2, 12, 0, tzinfo=timezone.utc)
+        time_range = {"from": "2026-03-01", "to": end.isoformat()}
+
+        claims = [
+            _claim("at_end", end.isoformat()),
+            _claim("past_end", (end + timedelta(microseconds=1)).isoformat()),
+        ]
+        results = NaturalLanguageSearchEngine._filter_by_time_range(claims, time_range)
+
+        assert [c["id"] for c in results] == ["at_end"]
+
+
+class TestIntentSessions:
+    """Isolation of intent-parsing LLM conversations"""
+
+    def test_each_query_gets_its_own_session(self, fake_llm):
+        """Different queries never share an LLM conversation"""
+        fake_llm.reply = '{"core_query": "water", "domains": ["Science"]}'
+
+        engine = NaturalLanguageSearchEngine(api_key="test-key")
+        queries = ["water quality", "river pollution", "ocean plastic"]
+
+        async def scenario():
+            return await asyncio.gather(*(engine.parse_search_intent(q) for q in queries))
+
+        asyncio.run(scenario())
+
+        sessions = fake_llm.sessions
+        assert len(sessions) == len(queries)
+        assert len({chat.session_id for chat in sessions}) == len(queries)
+        assert all(len(chat.history) == 1 for chat in sessions)
+
+
+class TestJsonResponse:
+    """Parsing JSON out of LLM replies"""
+
+    def test_embedded_and_invalid_json(self):
+        """JSON wrapped in prose is extracted; unparsable replies give None"""
+        parse = NaturalLanguageSearchEngine._parse_json_response
+
+        assert parse('Sure: {"a": 1} hope that helps') == {"a": 1}
+        assert parse('{"a": 1,} and {broken}') is None
+        assert parse("no json here") is None
@@ -0,0 +1,91 @@
+"""
+Originality Detection Tests
+Tests for: similarity LLM sessions, corpus token-overlap scoring, LLM JSON parsing
+"""
+import asyncio
+import sys
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from originality_detection import OriginalityDetector
+
+
+class TestSimilaritySessions:
+    """Isolation of similarity LLM conversations"""
+
+    def test_each_comparison_gets_its_own_session(self, fake_llm):
+        """Concurrent comparisons never share an LLM conversation"""
+        fake_llm.reply = '{"similarity": 0.4}'
+
+        detector = OriginalityDetector(api_key="test-key")
+        pairs = [(f"Claim {i} about rivers.", f"Other claim {i} about lakes.") for i in range(4)]
+
+        async def scenario():
+            return await asyncio.gather(
+                *(detector._calculate_semantic_similarity(a, b) for a, b in pairs)
+            )
+
+        scores = asyncio.run(scenario())
+
+        assert scores == [0.4] * len(pairs)
+        sessions = fake_llm.sessions
+        assert len(sessions) == len(pairs)
+        assert len({chat.session_id for chat in sessions}) == len(pairs)
+        assert all(len(chat.history) == 1 for chat in sessions)
+
+
+_CORPUS = [
+    "The river flooded the town after three days of heavy rain.",
+    "Heavy rain caused flooding in the town near the river.",
+    "",
+    "Solar panels now supply a third of the city's electricity.",
+    "the a an of",
+    "City officials say solar power supplies a third of electricity.",
+]
+
+
+class TestCorpusOverlap:
+    """Vectorized token overlap against the corpus index"""
+
+    def setup_method(self):
+        self.detector = OriginalityDetector(api_key="")
+        self.index = self.detector.index_claims([{"text": text} for text in _CORPUS])
+        self.queries = [
+            frozenset(self.detector._tokenize(text))
+            for text in ["River flooding after heavy rain in town", "solar electricity for the city", "", "unrelated words only"]
+        ]
+
+    def test_matches_pairwise_scores(self):
+        """Each query scores exactly as the per-pair set arithmetic does"""
+        positions = np.arange(len(_CORPUS))
+        for tokens in self.queries:
+            jaccard, overlap = self.index.similarities(tokens)
+            pair_jaccard, pair_overlap = self.index.similarities_at(tokens, positions)
+            assert np.array_equal(jaccard, pair_jaccard)
+            assert np.array_equal(overlap, pair_overlap)
+
+    def test_batch_matches_single_queries(self):
+        """Row k of a batch equals scoring query k on its own"""
+        jaccard, overlap = self.index.similarities_batch(self.queries)
+
+        assert jaccard.shape == overlap.shape == (len(self.queries), len(_CORPUS))
+        assert jaccard[0].any() and overlap[1].any()
+        for k, tokens in enumerate(self.queries):
+            single_jaccard, single_overlap = self.index.similarities(tokens)
+            assert np.array_equal(jaccard[k], single_jaccard)
+            assert np.array_equal(overlap[k], single_overlap)
+
+
+class TestJsonResponse:
+    """Parsing JSON out of LLM replies"""
+
+    def test_embedded_and_invalid_json(self):
+        """JSON wrapped in prose is extracted; unparsable replies give None"""
+        parse = OriginalityDetector._parse_json_response
+
+        assert parse('Sure: {"a": 1} hope that helps') == {"a": 1}
+        assert parse('{"a": 1,} and {broken}') is None
+        assert parse("no json here") is None